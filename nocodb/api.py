@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from urllib.parse import urljoin
 from .nocodb import NocoDBBase
 
@@ -41,6 +41,9 @@ class NocoDBAPI:
         # v2 API base URIs (for self-hosted features like bases list)
         self.__base_meta_uri_v2 = urljoin(base_uri + "/", NocoDBAPIUris.V2_META_PREFIX.value)
 
+        # Records URIs by (base_id, table_id); record loops hit the same few tables
+        self.__records_uris: Dict[Tuple[str, str], str] = {}
+
     # =========================================================================
     # v3 Data API URI Methods
     # =========================================================================
@@ -57,7 +60,12 @@ class NocoDBAPI:
         Returns:
             The URI for records operations
         """
-        return urljoin(self.__base_data_uri, "/".join((base_id, table_id, "records")))
+        key = (base_id, table_id)
+        uri = self.__records_uris.get(key)
+        if uri is None:
+            uri = urljoin(self.__base_data_uri, "/".join((base_id, table_id, "records")))
+            self.__records_uris[key] = uri
+        return uri
 
     def get_record_uri(self, base_id: str, table_id: str, record_id: str) -> str:
         """Get the URI for a specific record.
@@ -72,7 +80,7 @@ class NocoDBAPI:
         Returns:
             The URI for single record operations
         """
-        return urljoin(self.__base_data_uri, "/".join((base_id, table_id, "records", str(record_id))))
+        return f"{self.get_records_uri(base_id, table_id)}/{record_id}"
 
     def get_records_count_uri(self, base_id: str, table_id: str) -> str:
         """Get the URI for counting records.
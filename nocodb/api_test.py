@@ -0,0 +1,16 @@
+"""Tests for API URI building."""
+from urllib.parse import urljoin
+
+from .api import NocoDBAPI
+
+
+def test_record_uri_extends_cached_records_uri():
+    api = NocoDBAPI("https://app.nocodb.com/")
+
+    records_uri = api.get_records_uri("base123", "tbl456")
+
+    assert records_uri == "https://app.nocodb.com/api/v3/data/base123/tbl456/records"
+    assert api.get_records_uri("base123", "tbl456") is records_uri
+    assert api.get_record_uri("base123", "tbl456", 42) == urljoin(
+        "https://app.nocodb.com/api/v3/data/", "base123/tbl456/records/42"
+    )
@@ -8,6 +8,7 @@ Structure:
 - wrapper.py: Config injection, command aliasing, parameter mapping
 - generated.py: Auto-generated CLI with all MCP tools
 - config.py: Config file loading (~/.nocodbrc)
+- output.py: JSON output helpers installed over the generated printer (orjson when available)
 """
 
 from .main import main
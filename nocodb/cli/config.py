@@ -9,16 +9,12 @@ Config priority (highest to lowest):
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """NocoDB CLI configuration."""
 
@@ -61,6 +57,12 @@ def load_config_file(config_path: Optional[Path] = None) -> dict:
     if not path.exists():
         return {}
 
+    # Imported here so runs without a config file never load the TOML parser
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+
     try:
         with open(path, "rb") as f:
             return tomllib.load(f)
@@ -68,6 +70,7 @@ def load_config_file(config_path: Optional[Path] = None) -> dict:
         return {}
 
 
+@lru_cache(maxsize=1)
 def load_config(
     url: Optional[str] = None,
     token: Optional[str] = None,
@@ -82,43 +85,41 @@ def load_config(
     2. Environment variables
     3. Profile from config file
     4. Default section from config file
-    """
-    file_config = load_config_file(config_path)
 
+    The result is cached for the life of the process; call
+    ``load_config.cache_clear()`` after writing the config file.
+    """
     selected_profile = (
         profile
         or os.environ.get("NOCODB_PROFILE")
         or "default"
     )
 
+    url = url or os.environ.get("NOCODB_URL")
+    token = token or os.environ.get("NOCODB_TOKEN")
+    base_id = base_id or os.environ.get("NOCODB_BASE_ID")
+
+    # Flags and env already cover every field; don't touch the file
+    if url and token and base_id:
+        return Config(url=url, token=token, base_id=base_id, profile=selected_profile)
+
+    file_config = load_config_file(config_path)
+
     defaults = file_config.get("default", {})
     profile_config = file_config.get("profiles", {}).get(selected_profile, {})
 
     merged = {**defaults, **profile_config}
 
     return Config(
-        url=(
-            url
-            or os.environ.get("NOCODB_URL")
-            or merged.get("url", "")
-        ),
-        token=(
-            token
-            or os.environ.get("NOCODB_TOKEN")
-            or merged.get("token", "")
-        ),
-        base_id=(
-            base_id
-            or os.environ.get("NOCODB_BASE_ID")
-            or merged.get("base_id", "")
-        ),
+        url=url or merged.get("url", ""),
+        token=token or merged.get("token", ""),
+        base_id=base_id or merged.get("base_id", ""),
         profile=selected_profile,
     )
 
 
-def create_example_config() -> str:
-    """Return example config file content."""
-    return """# NocoDB CLI Configuration
+# Written by `nocodb init`
+EXAMPLE_CONFIG = """# NocoDB CLI Configuration
 # Save this file as ~/.nocodbrc
 
 [default]
@@ -135,3 +136,8 @@ url = "http://localhost:8080"
 # url = "http://localhost:8080"
 # base_id = "dev_base_id"
 """
+
+
+def create_example_config() -> str:
+    """Return example config file content."""
+    return EXAMPLE_CONFIG
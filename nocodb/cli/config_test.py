@@ -0,0 +1,36 @@
+"""Tests for CLI config loading."""
+import pytest
+
+from . import config
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    config.load_config.cache_clear()
+    yield
+    config.load_config.cache_clear()
+
+
+def test_file_fills_fields_missing_from_env(monkeypatch, tmp_path):
+    path = tmp_path / "nocodbrc"
+    path.write_text('[default]\nurl = "http://file"\nbase_id = "p_file"\n')
+    monkeypatch.setenv("NOCODB_TOKEN", "env-token")
+    monkeypatch.delenv("NOCODB_URL", raising=False)
+    monkeypatch.delenv("NOCODB_BASE_ID", raising=False)
+
+    result = config.load_config(url="http://flag", config_path=path)
+
+    assert (result.url, result.token, result.base_id) == ("http://flag", "env-token", "p_file")
+
+
+def test_file_not_read_when_all_fields_supplied(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOCODB_BASE_ID", "p_env")
+
+    def fail(config_path=None):
+        raise AssertionError("config file should not be read")
+
+    monkeypatch.setattr(config, "load_config_file", fail)
+
+    result = config.load_config(url="http://flag", token="tok")
+
+    assert (result.url, result.token, result.base_id) == ("http://flag", "tok", "p_env")
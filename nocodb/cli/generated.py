@@ -258,16 +258,21 @@ async def record_get(
     *,
     table_id: Annotated[str, cyclopts.Parameter(help="")],
     record_id: Annotated[str, cyclopts.Parameter(help="")],
+    fields: Annotated[str | None, cyclopts.Parameter(help="JSON Schema: {\n                            \"anyOf\": [\n                              {\n                                \"type\": \"string\"\n                              },\n                              {\n                                \"type\": \"null\"\n                              }\n                            ],\n                            \"default\": null\n                          }")] = None,
 ) -> None:
     '''Get a single record by ID.
 
 Args:
     table_id: The table ID (e.g., "tbl_xxx")
     record_id: The record ID (e.g., "1" or "rec_xxx")
+    fields: Comma-separated field names to include (e.g., "Name,Email,Status")
 
 Returns:
     RecordResult with id and fields.'''
-    await _call_tool('record_get', {'table_id': table_id, 'record_id': record_id})
+    # Parse JSON parameters
+    fields_parsed = json.loads(fields) if isinstance(fields, str) else fields
+
+    await _call_tool('record_get', {'table_id': table_id, 'record_id': record_id, 'fields': fields_parsed})
 
 
 @call_tool_app.command(name='records_create')
@@ -816,6 +821,27 @@ Returns:
     await _call_tool('view_delete', {'view_id': view_id, 'confirm': confirm})
 
 
+@call_tool_app.command(name='views_delete')
+async def views_delete(
+    *,
+    view_ids: Annotated[list[str], cyclopts.Parameter(help="")],
+    confirm: Annotated[bool, cyclopts.Parameter(help="")] = False,
+) -> None:
+    '''Delete several views in one call.
+
+The DELETE requests are sent concurrently. Only the views are deleted,
+not the underlying data. If only some of them fail, success is False
+and the result lists the deleted and failed IDs.
+
+Args:
+    view_ids: The view IDs (e.g., ["vw_xxx", "vw_yyy"])
+    confirm: Must be True to proceed with deletion
+
+Returns:
+    BulkDeleteResult with the deleted and failed view IDs.'''
+    await _call_tool('views_delete', {'view_ids': view_ids, 'confirm': confirm})
+
+
 @call_tool_app.command(name='view_filters_list')
 async def view_filters_list(
     *,
@@ -934,6 +960,27 @@ Returns:
     await _call_tool('view_filter_delete', {'filter_id': filter_id, 'confirm': confirm})
 
 
+@call_tool_app.command(name='view_filters_delete')
+async def view_filters_delete(
+    *,
+    filter_ids: Annotated[list[str], cyclopts.Parameter(help="")],
+    confirm: Annotated[bool, cyclopts.Parameter(help="")] = False,
+) -> None:
+    '''Delete several filters in one call.
+
+The DELETE requests are sent concurrently, so tearing down many filters
+costs about one round-trip instead of one per filter. If only some of
+them fail, success is False and the result lists the deleted and failed IDs.
+
+Args:
+    filter_ids: The filter IDs (e.g., ["flt_xxx", "flt_yyy"])
+    confirm: Must be True to proceed with deletion
+
+Returns:
+    BulkDeleteResult with the deleted and failed filter IDs.'''
+    await _call_tool('view_filters_delete', {'filter_ids': filter_ids, 'confirm': confirm})
+
+
 @call_tool_app.command(name='view_filter_children')
 async def view_filter_children(
     *,
@@ -1040,6 +1087,27 @@ Returns:
     await _call_tool('view_sort_delete', {'sort_id': sort_id, 'confirm': confirm})
 
 
+@call_tool_app.command(name='view_sorts_delete')
+async def view_sorts_delete(
+    *,
+    sort_ids: Annotated[list[str], cyclopts.Parameter(help="")],
+    confirm: Annotated[bool, cyclopts.Parameter(help="")] = False,
+) -> None:
+    '''Delete several sorts in one call.
+
+The DELETE requests are sent concurrently, so tearing down many sorts
+costs about one round-trip instead of one per sort. If only some of
+them fail, success is False and the result lists the deleted and failed IDs.
+
+Args:
+    sort_ids: The sort IDs (e.g., ["srt_xxx", "srt_yyy"])
+    confirm: Must be True to proceed with deletion
+
+Returns:
+    BulkDeleteResult with the deleted and failed sort IDs.'''
+    await _call_tool('view_sorts_delete', {'sort_ids': sort_ids, 'confirm': confirm})
+
+
 @call_tool_app.command(name='view_columns_list')
 async def view_columns_list(
     *,
@@ -1222,21 +1290,51 @@ Returns:
     await _call_tool('webhook_delete', {'hook_id': hook_id, 'confirm': confirm})
 
 
+@call_tool_app.command(name='webhooks_delete')
+async def webhooks_delete(
+    *,
+    hook_ids: Annotated[list[str], cyclopts.Parameter(help="")],
+    confirm: Annotated[bool, cyclopts.Parameter(help="")] = False,
+) -> None:
+    '''Delete several webhooks in one call.
+
+The DELETE requests are sent concurrently. If only some of them fail,
+success is False and the result lists the deleted and failed IDs.
+
+Args:
+    hook_ids: The webhook IDs (e.g., ["hk_xxx", "hk_yyy"])
+    confirm: Must be True to proceed with deletion
+
+Returns:
+    BulkDeleteResult with the deleted and failed webhook IDs.'''
+    await _call_tool('webhooks_delete', {'hook_ids': hook_ids, 'confirm': confirm})
+
+
 @call_tool_app.command(name='webhook_logs')
 async def webhook_logs(
     *,
     hook_id: Annotated[str, cyclopts.Parameter(help="")],
+    limit: Annotated[str | None, cyclopts.Parameter(help="JSON Schema: {\n                            \"anyOf\": [\n                              {\n                                \"type\": \"integer\"\n                              },\n                              {\n                                \"type\": \"null\"\n                              }\n                            ],\n                            \"default\": null\n                          }")] = None,
+    offset: Annotated[str | None, cyclopts.Parameter(help="JSON Schema: {\n                            \"anyOf\": [\n                              {\n                                \"type\": \"integer\"\n                              },\n                              {\n                                \"type\": \"null\"\n                              }\n                            ],\n                            \"default\": null\n                          }")] = None,
 ) -> None:
     '''View execution logs for a webhook.
 
-Useful for debugging webhook delivery issues.
+Useful for debugging webhook delivery issues. Busy webhooks can have
+thousands of log entries with full payloads; use limit/offset to fetch
+them a page at a time.
 
 Args:
     hook_id: The webhook ID (e.g., "hk_xxx")
+    limit: Maximum number of log entries to return (server default if omitted)
+    offset: Number of log entries to skip
 
 Returns:
     WebhookLogsResult with list of execution logs.'''
-    await _call_tool('webhook_logs', {'hook_id': hook_id})
+    # Parse JSON parameters
+    limit_parsed = json.loads(limit) if isinstance(limit, str) else limit
+    offset_parsed = json.loads(offset) if isinstance(offset, str) else offset
+
+    await _call_tool('webhook_logs', {'hook_id': hook_id, 'limit': limit_parsed, 'offset': offset_parsed})
 
 
 @call_tool_app.command(name='webhook_sample_payload')
@@ -13,7 +13,13 @@ Run ./scripts/regenerate-cli.sh after modifying MCP tools.
 import sys
 from pathlib import Path
 
-from .config import create_example_config
+INIT_HELP = """Usage: nocodb init [OPTIONS]
+
+Create example configuration file.
+
+Options:
+  --path, -p PATH  Config file path (default: ~/.nocodbrc)
+  --force, -f      Overwrite existing config"""
 
 
 def init_config(path: Path, force: bool = False) -> int:
@@ -22,11 +28,14 @@ def init_config(path: Path, force: bool = False) -> int:
     This is the only command handled directly - all others go through
     the generated CLI.
     """
+    from .config import create_example_config, load_config
+
     if path.exists() and not force:
         print(f"Error: Config file already exists at {path}. Use --force to overwrite.")
         return 1
 
     path.write_text(create_example_config())
+    load_config.cache_clear()
     print(f"Created config file at {path}")
     print("\nEdit the file and set your NocoDB URL.")
     print("For security, set your token via NOCODB_TOKEN environment variable.")
@@ -41,11 +50,7 @@ def main() -> int:
     if args and args[0] == "init":
         # Handle help for init
         if "--help" in args or "-h" in args:
-            print("Usage: nocodb init [OPTIONS]")
-            print("\nCreate example configuration file.\n")
-            print("Options:")
-            print("  --path, -p PATH  Config file path (default: ~/.nocodbrc)")
-            print("  --force, -f      Overwrite existing config")
+            print(INIT_HELP)
             return 0
 
         path = Path.home() / ".nocodbrc"
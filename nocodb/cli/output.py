@@ -0,0 +1,88 @@
+"""Output helpers for the NocoDB CLI.
+
+The generated CLI prints every structured tool result through rich's
+``print_json``, which serializes the whole payload, re-parses it and
+highlights it token by token. That is wasted work when the output is piped
+to ``jq`` or a file, and it holds several copies of large record pages in
+memory. These helpers are installed over the generated printer by the
+wrapper, so they survive ``scripts/regenerate-cli.sh``.
+"""
+
+import json
+import sys
+from typing import Any
+
+# Optional C encoder, pulled in by ``pip install "nocodb[cli]"``
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def write_json(data: Any) -> None:
+    """Write indented JSON to stdout.
+
+    With orjson, the payload is encoded to UTF-8 bytes in one call and
+    written straight to the binary stdout buffer. Otherwise it is streamed
+    chunk by chunk from the stdlib encoder without building the full string.
+    Both produce the same text.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # Not representable by orjson (e.g. non-str keys); use the stdlib encoder
+        else:
+            sys.stdout.flush()
+            buffer.write(payload)
+            buffer.flush()
+            return
+
+    write = sys.stdout.write
+    for chunk in _ENCODER.iterencode(data):
+        write(chunk)
+    write("\n")
+
+
+def write_text(blocks) -> None:
+    """Write text content blocks to stdout as-is, without rich markup or wrapping."""
+    write = sys.stdout.write
+    for block in blocks:
+        write(block.text)
+        write("\n")
+
+
+def print_json(data: Any, console) -> None:
+    """Print JSON: highlighted on a terminal, streamed plain text otherwise."""
+    if console.is_terminal:
+        console.print_json(data=data)
+    else:
+        write_json(data)
+
+
+def install(generated) -> None:
+    """Route tool results in the generated CLI through the helpers above.
+
+    Structured results go through print_json. When stdout is not a terminal,
+    plain text results are written directly instead of being rendered by
+    rich (which would parse markup and hard-wrap lines at 80 columns).
+    Errors and image/audio content still go through the generated printer.
+    """
+    original = generated._print_tool_result
+
+    def print_tool_result(result):
+        if not result.is_error:
+            if result.structured_content is not None:
+                print_json(result.structured_content, generated.console)
+                return
+            if not generated.console.is_terminal and all(
+                getattr(block, "type", None) == "text" for block in result.content
+            ):
+                write_text(result.content)
+                return
+        original(result)
+
+    generated._print_tool_result = print_tool_result
@@ -0,0 +1,76 @@
+"""Tests for CLI output helpers."""
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from . import output
+
+
+def test_write_json_streams_valid_json(capsys):
+    data = {"records": [{"id": 1, "fields": {"Name": "Zoë"}}]}
+    output.write_json(data)
+    out = capsys.readouterr().out
+    assert out.endswith("\n")
+    assert json.loads(out) == data
+    assert "Zoë" in out
+
+
+def test_write_json_stdlib_fallback_matches_orjson(capsys):
+    data = {"records": [{"id": 1, "fields": {"Name": "Zoë", "Tags": [], "Meta": {}}}]}
+    output.write_json(data)
+    default = capsys.readouterr().out
+
+    with mock.patch.object(output, "orjson", None):
+        output.write_json(data)
+    fallback = capsys.readouterr().out
+
+    assert fallback == default
+
+
+def test_print_json_uses_rich_on_terminal():
+    console = mock.Mock(is_terminal=True)
+    output.print_json({"a": 1}, console)
+    console.print_json.assert_called_once_with(data={"a": 1})
+
+
+def test_print_json_skips_rich_when_piped(capsys):
+    console = mock.Mock(is_terminal=False)
+    output.print_json({"a": 1}, console)
+    console.print_json.assert_not_called()
+    assert json.loads(capsys.readouterr().out) == {"a": 1}
+
+
+def test_install_only_overrides_structured_results(capsys):
+    original = mock.Mock()
+    generated = SimpleNamespace(
+        _print_tool_result=original,
+        console=mock.Mock(is_terminal=False),
+    )
+    output.install(generated)
+
+    ok = SimpleNamespace(is_error=False, structured_content={"count": 3})
+    generated._print_tool_result(ok)
+    assert json.loads(capsys.readouterr().out) == {"count": 3}
+    original.assert_not_called()
+
+    error = SimpleNamespace(is_error=True, structured_content=None)
+    generated._print_tool_result(error)
+    original.assert_called_once_with(error)
+
+
+def test_install_writes_plain_text_when_piped(capsys):
+    original = mock.Mock()
+    generated = SimpleNamespace(
+        _print_tool_result=original,
+        console=mock.Mock(is_terminal=False),
+    )
+    output.install(generated)
+
+    text = "[bold]not markup[/bold] " + "x" * 120
+    block = SimpleNamespace(type="text", text=text)
+    generated._print_tool_result(
+        SimpleNamespace(is_error=False, structured_content=None, content=[block])
+    )
+
+    assert capsys.readouterr().out == text + "\n"
+    original.assert_not_called()
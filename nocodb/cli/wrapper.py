@@ -4,15 +4,15 @@ Provides:
 1. Config injection - loads from ~/.nocodbrc and environment variables
 2. Command aliases - maps familiar commands to generated tool calls
 3. Parameter mapping - translates CLI flags to tool parameters
+4. Batch input - reads --data-file / --ids-file into a single tool call
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
-from .config import load_config
-
 # Command alias mapping: (group, command) -> tool_name
 COMMAND_ALIASES = {
     # Records
@@ -47,12 +47,14 @@ COMMAND_ALIASES = {
     ("views", "list"): "views_list",
     ("views", "update"): "view_update",
     ("views", "delete"): "view_delete",
+    ("views", "batch-delete"): "views_delete",
     # View filters
     ("filters", "list"): "view_filters_list",
     ("filters", "get"): "view_filter_get",
     ("filters", "create"): "view_filter_create",
     ("filters", "update"): "view_filter_update",
     ("filters", "delete"): "view_filter_delete",
+    ("filters", "batch-delete"): "view_filters_delete",
     ("filters", "children"): "view_filter_children",
     # View sorts
     ("sorts", "list"): "view_sorts_list",
@@ -60,6 +62,7 @@ COMMAND_ALIASES = {
     ("sorts", "create"): "view_sort_create",
     ("sorts", "update"): "view_sort_update",
     ("sorts", "delete"): "view_sort_delete",
+    ("sorts", "batch-delete"): "view_sorts_delete",
     # View columns
     ("columns", "list"): "view_columns_list",
     ("columns", "update"): "view_column_update",
@@ -73,6 +76,7 @@ COMMAND_ALIASES = {
     # Webhooks
     ("webhooks", "list"): "webhooks_list",
     ("webhooks", "delete"): "webhook_delete",
+    ("webhooks", "batch-delete"): "webhooks_delete",
     ("webhooks", "logs"): "webhook_logs",
     ("webhooks", "sample"): "webhook_sample_payload",
     ("webhooks", "filters"): "webhook_filters_list",
@@ -93,6 +97,49 @@ COMMAND_ALIASES = {
     ("schema", "base"): "schema_export_base",
 }
 
+
+def _nest_aliases(aliases: dict[tuple[str, str], str]) -> dict[str, dict[str, str]]:
+    """Regroup (group, command) -> tool into group -> command -> tool."""
+    nested: dict[str, dict[str, str]] = {}
+    for (group, cmd), tool_name in aliases.items():
+        nested.setdefault(group, {})[cmd] = tool_name
+    return nested
+
+
+# COMMAND_ALIASES nested by group, so lookups don't build a tuple key
+GROUP_COMMANDS = _nest_aliases(COMMAND_ALIASES)
+
+# Tools guarded by require_confirm; they fail without --confirm true
+CONFIRM_TOOLS = frozenset({
+    "records_delete",
+    "table_delete",
+    "field_delete",
+    "linked_records_unlink",
+    "view_delete",
+    "views_delete",
+    "view_filter_delete",
+    "view_filters_delete",
+    "view_sort_delete",
+    "view_sorts_delete",
+    "shared_view_delete",
+    "webhook_delete",
+    "webhooks_delete",
+    "member_remove",
+})
+
+# Global options consumed by the wrapper: flag -> inject_config_to_env argument
+GLOBAL_OPTIONS = {
+    "--url": "url",
+    "-u": "url",
+    "--token": "token",
+    "--base-id": "base_id",
+    "-b": "base_id",
+    "--profile": "profile",
+    "-p": "profile",
+    "--config": "config",
+    "-c": "config",
+}
+
 # Parameter alias mapping: --kebab-case -> --snake_case for generated CLI
 PARAM_ALIASES = {
     "--table-id": "--table_id",
@@ -112,6 +159,10 @@ PARAM_ALIASES = {
     "--col-options": "--col_options",
     "--column-id": "--column_id",
     "--target-ids": "--target_ids",
+    "--filter-ids": "--filter_ids",
+    "--sort-ids": "--sort_ids",
+    "--view-ids": "--view_ids",
+    "--hook-ids": "--hook_ids",
     "--record-ids": "--record_ids",
     "--content-base64": "--content_base64",
     "--content-type": "--content_type",
@@ -124,6 +175,40 @@ PARAM_ALIASES = {
     "-v": "--view_id",
 }
 
+# Extensions treated as newline-delimited JSON (one record per line)
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+_ARRAY_START = re.compile(r"\s*\[")
+
+
+def read_records_file(path: Path) -> str:
+    """Read a JSON array/object file or an NDJSON file as a JSON array string.
+
+    Lets bulk loads go through one CLI invocation (and one tool call)
+    instead of one invocation per row. The file is read once and not parsed
+    here: the generated CLI parses the --records value anyway, so NDJSON
+    lines are simply joined into an array.
+    """
+    content = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in NDJSON_SUFFIXES:
+        lines = ",".join(line for line in content.splitlines() if line.strip())
+        return f"[{lines}]"
+    # JSON allows surrounding whitespace, so an array file is passed through
+    # as read rather than stripped into a second full-size copy
+    if _ARRAY_START.match(content):
+        return content
+    return f"[{content}]"
+
+
+def load_ids_file(path: Path) -> list[str]:
+    """Load record IDs from a file, one ID per line.
+
+    IDs never contain whitespace, so a single str.split() strips and drops
+    blank lines in one pass. IDs are kept as strings; the tool takes
+    list[str] and the API accepts numeric IDs as strings.
+    """
+    return path.read_text(encoding="utf-8").split()
+
 
 def inject_config_to_env(
     url: Optional[str] = None,
@@ -136,6 +221,8 @@ def inject_config_to_env(
 
     The generated CLI connects to the MCP server, which reads these env vars.
     """
+    from .config import load_config
+
     config = load_config(
         url=url,
         token=token,
@@ -144,13 +231,15 @@ def inject_config_to_env(
         config_path=config_path,
     )
 
-    # Only set if not already set (CLI flags override env)
-    if config.url and not os.environ.get("NOCODB_URL"):
-        os.environ["NOCODB_URL"] = config.url
-    if config.token and not os.environ.get("NOCODB_TOKEN"):
-        os.environ["NOCODB_TOKEN"] = config.token
-    if config.base_id and not os.environ.get("NOCODB_BASE_ID"):
-        os.environ["NOCODB_BASE_ID"] = config.base_id
+    # load_config already applied flag > env > file priority, so the
+    # resolved values can be written without reading the env back first
+    env = os.environ
+    if config.url:
+        env["NOCODB_URL"] = config.url
+    if config.token:
+        env["NOCODB_TOKEN"] = config.token
+    if config.base_id:
+        env["NOCODB_BASE_ID"] = config.base_id
 
 
 def transform_args(args: list[str]) -> list[str]:
@@ -165,43 +254,74 @@ def transform_args(args: list[str]) -> list[str]:
         return args
 
     # Handle shortcut commands: "list bases" -> "bases list"
-    if args[0] == "list" and len(args) > 1:
-        resource = args[1]
-        return transform_args([resource, "list"] + args[2:])
-    elif args[0] == "get" and len(args) > 1:
-        resource = args[1]
-        return transform_args([resource, "get"] + args[2:])
+    if args[0] in ("list", "get") and len(args) > 1:
+        args = [args[1], args[0], *args[2:]]
 
     # Check for command alias
     if len(args) >= 2:
-        group, cmd = args[0], args[1]
-        tool_name = COMMAND_ALIASES.get((group, cmd))
+        commands = GROUP_COMMANDS.get(args[0])
+        tool_name = commands.get(args[1]) if commands else None
         if tool_name:
             # Transform to: call-tool <tool_name> <remaining_args>
             remaining = args[2:]
-            transformed = ["call-tool", tool_name] + transform_params(remaining)
+            transformed = ["call-tool", tool_name] + transform_params(remaining, tool_name)
             return transformed
 
     # Not a known command, pass through with param transformation
+    if args[0] == "call-tool" and len(args) > 1:
+        return args[:2] + transform_params(args[2:], args[1])
     return transform_params(args)
 
 
-def transform_params(args: list[str]) -> list[str]:
-    """Transform parameter names and handle special flags."""
+def missing_confirm(transformed: list[str]) -> Optional[str]:
+    """Return the tool name if a destructive call was made without --force.
+
+    Lets the wrapper reject the call before loading config and spawning the
+    MCP server, which would only reply with a confirm error. Both
+    "--confirm true" and "--confirm=true" count as confirmed, and help
+    requests (--help/-h) are never rejected.
+    """
+    if len(transformed) >= 2 and transformed[0] == "call-tool":
+        tool_name = transformed[1]
+        if tool_name not in CONFIRM_TOOLS:
+            return None
+        for arg in transformed[2:]:
+            if arg in ("--help", "-h", "--confirm") or arg.startswith("--confirm="):
+                return None
+        return tool_name
+    return None
+
+
+def transform_params(args: list[str], tool_name: Optional[str] = None) -> list[str]:
+    """Transform parameter names and handle special flags.
+
+    --force/-f only become --confirm true for tools in CONFIRM_TOOLS; for
+    anything else -f keeps its --filter alias and --force is passed through.
+    """
+    destructive = tool_name in CONFIRM_TOOLS
     result = []
     i = 0
     while i < len(args):
         arg = args[i]
 
         # Handle --force/-f for destructive operations
-        if arg in ("--force", "-f"):
-            # Only transform to --confirm if this looks like a destructive command
-            # (has --confirm parameter in the tool). We'll add --confirm true
+        if destructive and arg in ("--force", "-f"):
             result.append("--confirm")
             result.append("true")
             i += 1
             continue
 
+        # Handle batch input files
+        if arg == "--data-file" and i + 1 < len(args):
+            result.extend(["--records", read_records_file(Path(args[i + 1]))])
+            i += 2
+            continue
+        if arg == "--ids-file" and i + 1 < len(args):
+            for record_id in load_ids_file(Path(args[i + 1])):
+                result.extend(["--record_ids", record_id])
+            i += 2
+            continue
+
         # Handle parameter aliases
         if arg in PARAM_ALIASES:
             result.append(PARAM_ALIASES[arg])
@@ -218,35 +338,16 @@ def run_wrapped_cli(args: Optional[list[str]] = None) -> int:
         args = sys.argv[1:]
 
     # Extract global options before transformation
-    url = None
-    token = None
-    base_id = None
-    profile = None
-    config_path = None
+    options: dict[str, str] = {}
 
     filtered_args = []
     i = 0
     while i < len(args):
         arg = args[i]
 
-        if arg in ("--url", "-u") and i + 1 < len(args):
-            url = args[i + 1]
-            i += 2
-            continue
-        elif arg in ("--token",) and i + 1 < len(args):
-            token = args[i + 1]
-            i += 2
-            continue
-        elif arg in ("--base-id", "-b") and i + 1 < len(args):
-            base_id = args[i + 1]
-            i += 2
-            continue
-        elif arg in ("--profile", "-p") and i + 1 < len(args):
-            profile = args[i + 1]
-            i += 2
-            continue
-        elif arg in ("--config", "-c") and i + 1 < len(args):
-            config_path = Path(args[i + 1])
+        key = GLOBAL_OPTIONS.get(arg)
+        if key and i + 1 < len(args):
+            options[key] = args[i + 1]
             i += 2
             continue
         elif arg in ("--version", "-V"):
@@ -257,15 +358,34 @@ def run_wrapped_cli(args: Optional[list[str]] = None) -> int:
         filtered_args.append(arg)
         i += 1
 
-    # Inject config into environment
-    inject_config_to_env(url, token, base_id, profile, config_path)
-
     # Transform args
     transformed = transform_args(filtered_args)
 
+    # Fail fast on unconfirmed destructive calls, before any setup work
+    tool_name = missing_confirm(transformed)
+    if tool_name:
+        print(
+            f"Error: {tool_name} is destructive. Pass --force to proceed.",
+            file=sys.stderr,
+        )
+        return 1
+
+    # Inject config into environment
+    config_path = options.get("config")
+    inject_config_to_env(
+        options.get("url"),
+        options.get("token"),
+        options.get("base_id"),
+        options.get("profile"),
+        Path(config_path) if config_path is not None else None,
+    )
+
     # Import and run the generated CLI
+    from . import generated, output
     from .generated import app
 
+    output.install(generated)
+
     # cyclopts uses sys.argv, so we need to update it
     sys.argv = ["nocodb"] + transformed
 
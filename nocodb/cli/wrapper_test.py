@@ -0,0 +1,154 @@
+"""Tests for CLI argument transformation."""
+import json
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from .wrapper import COMMAND_ALIASES, CONFIRM_TOOLS, missing_confirm, transform_args
+
+
+def test_records_alias_maps_to_call_tool():
+    assert transform_args(["records", "list", "--table-id", "tbl_1"]) == [
+        "call-tool", "records_list", "--table_id", "tbl_1",
+    ]
+
+
+def test_data_file_ndjson_becomes_records_param(tmp_path):
+    path = tmp_path / "rows.ndjson"
+    path.write_text('{"Name": "A"}\n\n{"Name": "B"}\n')
+
+    result = transform_args(["records", "create", "-t", "tbl_1", "--data-file", str(path)])
+
+    assert result[:4] == ["call-tool", "records_create", "--table_id", "tbl_1"]
+    assert result[4] == "--records"
+    assert json.loads(result[5]) == [{"Name": "A"}, {"Name": "B"}]
+
+
+def test_data_file_single_object_is_wrapped_in_array(tmp_path):
+    path = tmp_path / "row.json"
+    path.write_text('\n{"Name": "A"}\n')
+
+    result = transform_args(["records", "create", "--data-file", str(path)])
+
+    assert json.loads(result[result.index("--records") + 1]) == [{"Name": "A"}]
+
+
+def test_data_file_json_array_becomes_records_param(tmp_path):
+    path = tmp_path / "rows.json"
+    path.write_text('[{"id": 1, "Status": "Done"}]')
+
+    result = transform_args(["records", "update", "--data-file", str(path)])
+
+    assert json.loads(result[result.index("--records") + 1]) == [{"id": 1, "Status": "Done"}]
+
+
+def test_ids_file_expands_to_record_ids(tmp_path):
+    path = tmp_path / "ids.txt"
+    path.write_text("1\n2\n\n3\n")
+
+    result = transform_args(["records", "delete", "--ids-file", str(path), "--force"])
+
+    assert result == [
+        "call-tool", "records_delete",
+        "--record_ids", "1", "--record_ids", "2", "--record_ids", "3",
+        "--confirm", "true",
+    ]
+
+
+def test_missing_confirm_flags_unforced_destructive_call():
+    assert missing_confirm(transform_args(["tables", "delete", "-t", "tbl_1"])) == "table_delete"
+    assert missing_confirm(transform_args(["tables", "delete", "-t", "tbl_1", "--force"])) is None
+    assert missing_confirm(transform_args(["tables", "list"])) is None
+
+
+def test_missing_confirm_accepts_equals_form_and_help():
+    assert missing_confirm(["call-tool", "records_delete", "--confirm=true"]) is None
+    assert missing_confirm(transform_args(["records", "delete", "--help"])) is None
+    assert missing_confirm(transform_args(["records", "delete", "-h"])) is None
+
+
+def test_destructive_help_is_not_rejected(monkeypatch):
+    from . import wrapper
+
+    class Stop(Exception):
+        pass
+
+    def fake_inject(*args):
+        raise Stop
+
+    monkeypatch.setattr(wrapper, "inject_config_to_env", fake_inject)
+
+    # Reaching config injection means the help request went on to the generated CLI
+    with pytest.raises(Stop):
+        wrapper.run_wrapped_cli(["records", "delete", "--help"])
+
+
+def test_filters_batch_delete_maps_ids_and_force():
+    assert transform_args(
+        ["filters", "batch-delete", "--filter-ids", "flt_a", "--filter-ids", "flt_b", "--force"]
+    ) == [
+        "call-tool", "view_filters_delete",
+        "--filter_ids", "flt_a", "--filter_ids", "flt_b",
+        "--confirm", "true",
+    ]
+
+
+def test_aliases_point_at_generated_commands():
+    # Read the command names from source: importing generated.py needs cyclopts
+    source = (Path(__file__).parent / "generated.py").read_text()
+    generated = set(re.findall(r"@call_tool_app\.command\(name='(\w+)'\)", source))
+
+    assert set(COMMAND_ALIASES.values()) - generated == set()
+    assert CONFIRM_TOOLS - generated == set()
+
+
+def test_force_only_maps_to_confirm_for_destructive_tools():
+    assert transform_args(["tables", "list", "-f", "(Title,eq,A)"]) == [
+        "call-tool", "tables_list", "--filter", "(Title,eq,A)",
+    ]
+    assert transform_args(["tables", "delete", "-t", "tbl_1", "-f"])[-2:] == ["--confirm", "true"]
+    assert transform_args(["call-tool", "table_delete", "--force"]) == [
+        "call-tool", "table_delete", "--confirm", "true",
+    ]
+
+
+def test_list_and_get_shortcuts_map_to_group_commands():
+    assert transform_args(["list", "bases"]) == ["call-tool", "bases_list"]
+    assert transform_args(["get", "tables", "-t", "tbl_1"]) == [
+        "call-tool", "table_get", "--table_id", "tbl_1",
+    ]
+
+
+def test_global_options_are_consumed_before_transform(monkeypatch):
+    from . import wrapper
+
+    class Stop(Exception):
+        pass
+
+    def fake_inject(*args):
+        raise Stop(args)
+
+    monkeypatch.setattr(wrapper, "inject_config_to_env", fake_inject)
+
+    with pytest.raises(Stop) as exc_info:
+        wrapper.run_wrapped_cli(["-u", "http://x", "--profile", "dev", "-c", "rc", "tables", "list"])
+
+    assert exc_info.value.args[0] == ("http://x", None, None, "dev", Path("rc"))
+
+
+def test_inject_config_flag_overrides_env(monkeypatch, tmp_path):
+    from . import config, wrapper
+
+    monkeypatch.setenv("NOCODB_URL", "http://env")
+    monkeypatch.setenv("NOCODB_TOKEN", "env-token")
+    monkeypatch.setenv("NOCODB_BASE_ID", "")
+    config.load_config.cache_clear()
+
+    wrapper.inject_config_to_env(url="http://flag", config_path=tmp_path / "missing")
+    config.load_config.cache_clear()
+
+    assert os.environ["NOCODB_URL"] == "http://flag"
+    assert os.environ["NOCODB_TOKEN"] == "env-token"
+    assert os.environ["NOCODB_BASE_ID"] == ""
@@ -0,0 +1,5 @@
+import importlib.util
+
+# The MCP package imports fastmcp on import, so its tests can only be
+# collected when the mcp extra is installed
+collect_ignore_glob = [] if importlib.util.find_spec("fastmcp") else ["mcp/*"]
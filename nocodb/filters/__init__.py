@@ -26,19 +26,21 @@ class IsFilter(WhereFilter):
         IsFilter("Status", "null") -> (Status,is,null)
         IsFilter("Active", "true") -> (Active,is,true)
     """
-    VALID_VALUES = {"null", "notnull", "true", "false", "empty", "notempty"}
+    __slots__ = ("_where",)
+
+    VALID_VALUES = frozenset({"null", "notnull", "true", "false", "empty", "notempty"})
+    _VALID_VALUES_TEXT = ", ".join(sorted(VALID_VALUES))
 
     def __init__(self, column_name: str, value: str):
         if value not in self.VALID_VALUES:
             raise ValueError(
                 f"Invalid IsFilter value '{value}'. "
-                f"Valid values: {', '.join(sorted(self.VALID_VALUES))}"
+                f"Valid values: {self._VALID_VALUES_TEXT}"
             )
-        self.__column_name = column_name
-        self.__value = value
+        self._where = f"({column_name},is,{value})"
 
     def get_where(self) -> str:
-        return f"({self.__column_name},is,{self.__value})"
+        return self._where
 
 
 class InFilter(WhereFilter):
@@ -49,15 +51,16 @@ class InFilter(WhereFilter):
         InFilter("Tags", ["urgent", "important"]) -> (Tags,in,urgent,important)
         InFilter("Status", ["open", "pending"]) -> (Status,in,open,pending)
     """
+    __slots__ = ("_where",)
+
     def __init__(self, column_name: str, values: List[Union[str, int, float]]):
         if not values:
             raise ValueError("InFilter requires at least one value")
-        self.__column_name = column_name
-        self.__values = values
+        values_str = ",".join(map(str, values))
+        self._where = f"({column_name},in,{values_str})"
 
     def get_where(self) -> str:
-        values_str = ",".join(str(v) for v in self.__values)
-        return f"({self.__column_name},in,{values_str})"
+        return self._where
 
 
 class BetweenFilter(WhereFilter):
@@ -68,13 +71,13 @@ class BetweenFilter(WhereFilter):
         BetweenFilter("Date", "2024-01-01", "2024-12-31") -> (Date,btw,2024-01-01,2024-12-31)
         BetweenFilter("Age", 18, 65) -> (Age,btw,18,65)
     """
+    __slots__ = ("_where",)
+
     def __init__(self, column_name: str, start: Union[str, int, float], end: Union[str, int, float]):
-        self.__column_name = column_name
-        self.__start = start
-        self.__end = end
+        self._where = f"({column_name},btw,{start},{end})"
 
     def get_where(self) -> str:
-        return f"({self.__column_name},btw,{self.__start},{self.__end})"
+        return self._where
 
 
 __all__ = [
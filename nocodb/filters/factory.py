@@ -1,15 +1,18 @@
 from ..nocodb import WhereFilter
 
-from .raw_filter import RawTemplateFilter
-
 
 def basic_filter_class_factory(filter_name: str):
     return raw_template_filter_class_factory('({},' + filter_name + ',{})')
 
 def raw_template_filter_class_factory(template: str):
+    # Bound once per class so construction is a single format call
+    render = template.format
+
     class WrappedFilter(WhereFilter):
+        __slots__ = ("_where",)
+
         def __init__(self, *args, **kwargs):
-            self.__filter = RawTemplateFilter(template, *args, **kwargs)
+            self._where = render(*args, **kwargs)
         def get_where(self) -> str:
-            return self.__filter.get_where()
+            return self._where
     return WrappedFilter
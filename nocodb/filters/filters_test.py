@@ -150,6 +150,16 @@ def test_between_filter_numeric():
     assert between_filter.get_where() == "(Age,btw,18,65)"
 
 
+@pytest.mark.parametrize("where_filter", [
+    filters.IsFilter("Status", "null"),
+    filters.InFilter("Tags", ["a", "b"]),
+    filters.BetweenFilter("Age", 18, 65),
+])
+def test_v3_filters_are_slotted(where_filter):
+    """Test v3 filter classes carry no per-instance __dict__."""
+    assert not hasattr(where_filter, "__dict__")
+
+
 def test_not_like_filter():
     """Test NotLikeFilter for 'does not contain' matching."""
     not_like_filter = filters.NotLikeFilter("Name", "test")
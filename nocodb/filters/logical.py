@@ -1,26 +1,55 @@
-from typing import List
+from typing import List, Optional
 from ..nocodb import WhereFilter
 
 
+def _flatten(cls: type, filters: tuple) -> tuple:
+    """Splice same-operator children in: And(And(a, b), c) -> And(a, b, c)."""
+    if not any(type(f) is cls for f in filters):
+        return filters
+    flat = []
+    for f in filters:
+        if type(f) is cls:
+            flat.extend(f._filters)
+        else:
+            flat.append(f)
+    return tuple(flat)
+
+
 class Or(WhereFilter):
+    __slots__ = ("_filters", "_where")
+
     def __init__(self, *filters: List[WhereFilter]):
-        self.__filters = filters
+        self._filters = _flatten(Or, filters)
+        self._where: Optional[str] = None
 
     def get_where(self) -> str:
-        return '~or'.join([filter.get_where() for filter in self.__filters])
+        # Children are fixed at construction, so render the chain once
+        if self._where is None:
+            self._where = '~or'.join([filter.get_where() for filter in self._filters])
+        return self._where
 
 
 class And(WhereFilter):
+    __slots__ = ("_filters", "_where")
+
     def __init__(self, *filters: List[WhereFilter]):
-        self.__filters = filters
+        self._filters = _flatten(And, filters)
+        self._where: Optional[str] = None
 
     def get_where(self) -> str:
-        return '~and'.join([filter.get_where() for filter in self.__filters])
+        if self._where is None:
+            self._where = '~and'.join([filter.get_where() for filter in self._filters])
+        return self._where
 
 
 class Not(WhereFilter):
+    __slots__ = ("_filter", "_where")
+
     def __init__(self, filter: WhereFilter):
-        self.__filter = filter
+        self._filter = filter
+        self._where: Optional[str] = None
 
     def get_where(self) -> str:
-        return f"~not{self.__filter.get_where()}"
+        if self._where is None:
+            self._where = f"~not{self._filter.get_where()}"
+        return self._where
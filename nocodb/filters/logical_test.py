@@ -90,3 +90,31 @@ def test_v3_operators_in_logical():
     and_filter = filters.And(gte_filter, lte_filter)
     # v3 uses gte/lte (not ge/le) with ~and
     assert and_filter.get_where() == "(age,gte,18)~and(age,lte,65)"
+
+
+def test_logical_filters_render_children_once():
+    """Test And/Or/Not cache their where string across get_where() calls."""
+    from nocodb.nocodb import WhereFilter
+
+    class CountingFilter(WhereFilter):
+        calls = 0
+
+        def get_where(self) -> str:
+            CountingFilter.calls += 1
+            return "(a,eq,1)"
+
+    combined = filters.Not(filters.And(CountingFilter(), filters.Or(CountingFilter())))
+    assert combined.get_where() == "~not(a,eq,1)~and(a,eq,1)"
+    assert combined.get_where() == "~not(a,eq,1)~and(a,eq,1)"
+    assert CountingFilter.calls == 2
+
+
+def test_nested_same_operator_is_flattened():
+    """Test nested And/Or of the same kind collapse into one chain."""
+    a, b, c = (filters.EqFilter(x, "1") for x in "abc")
+    nested = filters.And(filters.And(a, b), c)
+    assert nested._filters == (a, b, c)
+    assert nested.get_where() == "(a,eq,1)~and(b,eq,1)~and(c,eq,1)"
+
+    mixed = filters.Or(filters.And(a, b), c)
+    assert len(mixed._filters) == 2
@@ -2,18 +2,20 @@ from ..nocodb import WhereFilter
 
 
 class RawFilter(WhereFilter):
+    __slots__ = ("_raw",)
+
     def __init__(self, raw: str):
-        self.__raw = raw
+        self._raw = raw
 
     def get_where(self) -> str:
-        return self.__raw
+        return self._raw
 
 
 class RawTemplateFilter(WhereFilter):
+    __slots__ = ("_where",)
+
     def __init__(self, template: str, *args, **kwargs):
-        self.__template = template
-        self.__template_values = args
-        self.__template_kvalues = kwargs
+        self._where = template.format(*args, **kwargs)
 
     def get_where(self) -> str:
-        return self.__template.format(*self.__template_values, **self.__template_kvalues)
+        return self._where
@@ -1,6 +1,7 @@
 import base64
+import os
 import warnings
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterator, Union, BinaryIO
 from ..nocodb import (
     NocoDBClient,
     NocoDBBase,
@@ -13,6 +14,52 @@ from ..exceptions import NocoDBAPIError
 
 import requests
 
+# Optional C JSON parser; responses fall back to requests' stdlib decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Upload types resolved without loading the system mime.types database
+_COMMON_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".txt": "text/plain",
+    ".csv": "text/csv",
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".json": "application/json",
+    ".xml": "application/xml",
+    ".zip": "application/zip",
+    ".mp3": "audio/mpeg",
+    ".mp4": "video/mp4",
+    ".doc": "application/msword",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".xls": "application/vnd.ms-excel",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def _guess_content_type(filename: str) -> str:
+    """Guess a MIME type from the filename extension.
+
+    Common extensions come from a static table; the mimetypes module (which
+    reads the system mime.types files on first use) is only consulted for
+    anything else.
+    """
+    _, ext = os.path.splitext(filename)
+    content_type = _COMMON_MIME_TYPES.get(ext.lower())
+    if content_type is None:
+        import mimetypes
+
+        content_type, _ = mimetypes.guess_type(filename)
+    return content_type or "application/octet-stream"
+
 
 class NocoDBRequestsClient(NocoDBClient):
     def __init__(self, auth_token: AuthToken, base_uri: str, verify_ssl: bool = True):
@@ -26,13 +73,15 @@ class NocoDBRequestsClient(NocoDBClient):
 
     def _request(self, method: str, url: str, *args, **kwargs):
         response = self.__session.request(method, url, *args, **kwargs)
-        response_json = None
         try:
             response.raise_for_status()
-            response_json = response.json()
-        except requests.exceptions.JSONDecodeError:
-            ...
         except requests.exceptions.HTTPError as http_error:
+            # Only error bodies are parsed here; callers parse successful
+            # responses themselves (or not at all, e.g. CSV exports)
+            try:
+                response_json = response.json()
+            except requests.exceptions.JSONDecodeError:
+                response_json = None
             raise NocoDBAPIError(
                 message=str(http_error),
                 status_code=http_error.response.status_code,
@@ -42,6 +91,17 @@ class NocoDBRequestsClient(NocoDBClient):
 
         return response
 
+    def _request_json(self, method: str, url: str, *args, **kwargs):
+        """Send a request and parse the JSON body of the successful response."""
+        response = self._request(method, url, *args, **kwargs)
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # Empty bodies, NaN, >64-bit ints: let requests decode or raise as before
+                pass
+        return response.json()
+
     # =========================================================================
     # v3 Data API Methods
     # =========================================================================
@@ -72,13 +132,14 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"records": [{"id": 1, "fields": {...}}], "next": "url"}
         """
         url = self.__api_info.get_records_uri(base_id, table_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def record_get_v3(
         self,
         base_id: str,
         table_id: str,
         record_id: Union[int, str],
+        params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Get a single record using v3 API.
 
@@ -88,13 +149,15 @@ class NocoDBRequestsClient(NocoDBClient):
             base_id: The base (project) ID
             table_id: The table ID
             record_id: The record ID
+            params: Optional query parameters (e.g., {"fields": "Name,Status"}
+                to return only those fields)
 
         Returns:
             Dict with 'id' and 'fields'
             Example: {"id": 1, "fields": {"Name": "John", "Age": 30}}
         """
         url = self.__api_info.get_record_uri(base_id, table_id, str(record_id))
-        return self._request("GET", url).json()
+        return self._request_json("GET", url, params=params)
 
     def records_create_v3(
         self,
@@ -126,7 +189,7 @@ class NocoDBRequestsClient(NocoDBClient):
         else:
             body = records
 
-        result = self._request("POST", url, json=body).json()
+        result = self._request_json("POST", url, json=body)
         # v3 API returns {"records": [...]} wrapper
         return result.get("records", result)
 
@@ -160,7 +223,7 @@ class NocoDBRequestsClient(NocoDBClient):
         else:
             body = records
 
-        result = self._request("PATCH", url, json=body).json()
+        result = self._request_json("PATCH", url, json=body)
         # v3 API returns {"records": [...]} wrapper
         return result.get("records", result)
 
@@ -191,7 +254,7 @@ class NocoDBRequestsClient(NocoDBClient):
         else:
             body = [{"id": rid} for rid in record_ids]
 
-        result = self._request("DELETE", url, json=body).json()
+        result = self._request_json("DELETE", url, json=body)
         # v3 API returns {"records": [...]} wrapper
         return result.get("records", result)
 
@@ -215,7 +278,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"count": 42}
         """
         url = self.__api_info.get_records_count_uri(base_id, table_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def records_list_all_v3(
         self,
@@ -245,14 +308,84 @@ class NocoDBRequestsClient(NocoDBClient):
                 "where": "(Status,eq,Active)"
             })
         """
-        from ..utils import collect_all_v3
+        return list(self.records_iter_v3(base_id, table_id, params, max_pages))
+
+    def records_iter_v3(
+        self,
+        base_id: str,
+        table_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over ALL records from a table, fetching pages lazily.
+
+        Like records_list_all_v3, but yields each record as soon as its page
+        arrives instead of collecting every page first. Only one page is held
+        in memory at a time, and callers can stop early without fetching the
+        remaining pages. All requests reuse the client's HTTP session.
+
+        Args:
+            base_id: The base (project) ID
+            table_id: The table ID
+            params: Optional query parameters (pageSize, where, sort, etc.)
+            max_pages: Optional limit on pages to fetch (None = unlimited)
+            prefetch: If True, fetch the next page in the background while the
+                current one is being consumed (useful when each record takes
+                noticeable time to process, e.g. writing to a slow sink)
+
+        Yields:
+            Records with 'id' and 'fields' keys.
+
+        Example:
+            for record in client.records_iter_v3(base_id, table_id, params={"pageSize": 200}):
+                writer.writerow(record["fields"])
+        """
+        from ..utils import paginate_v3
 
+        # paginate_v3 builds each page's params itself, so no copy is needed here
         def fetch(p: Dict[str, Any]) -> Dict[str, Any]:
-            merged_params = dict(params or {})
-            merged_params.update(p)
-            return self.records_list_v3(base_id, table_id, params=merged_params)
+            return self.records_list_v3(base_id, table_id, params=p)
+
+        return paginate_v3(fetch, params, max_pages, prefetch=prefetch)
 
-        return collect_all_v3(fetch, params, max_pages)
+    def records_get_many_v3(
+        self,
+        base_id: str,
+        table_id: str,
+        record_ids: List[Union[int, str]],
+        params: Optional[Dict[str, Any]] = None,
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """Fetch several records by ID, a few requests at a time.
+
+        Useful after records_list_v3 when each row needs its full detail:
+        the GET requests overlap instead of running one after another.
+
+        Args:
+            base_id: The base (project) ID
+            table_id: The table ID
+            record_ids: The record IDs to fetch
+            params: Optional query parameters applied to every fetch (e.g. fields)
+            max_workers: Maximum number of concurrent requests (default: 4)
+
+        Returns:
+            Records in the same order as record_ids.
+
+        Raises:
+            NocoDBAPIError: The first failing fetch's error (in input order),
+                after every other fetch has run.
+        """
+        from ..utils import run_each
+
+        outcome = run_each(
+            lambda record_id: self.record_get_v3(base_id, table_id, record_id, params=params),
+            record_ids,
+            max_workers=max_workers,
+        )
+        if outcome.failures:
+            raise outcome.failures[0].error
+        return outcome.results
 
     def linked_records_list_v3(
         self,
@@ -285,7 +418,7 @@ class NocoDBRequestsClient(NocoDBClient):
             May include optional 'next' pagination URL for hm relationships.
         """
         url = self.__api_info.get_linked_records_uri(base_id, table_id, link_field_id, str(record_id))
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def linked_records_link_v3(
         self,
@@ -318,7 +451,7 @@ class NocoDBRequestsClient(NocoDBClient):
         else:
             body = [{"id": rid} for rid in linked_record_ids]
 
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def linked_records_unlink_v3(
         self,
@@ -351,7 +484,7 @@ class NocoDBRequestsClient(NocoDBClient):
         else:
             body = [{"id": rid} for rid in linked_record_ids]
 
-        return self._request("DELETE", url, json=body).json()
+        return self._request_json("DELETE", url, json=body)
 
     def attachment_upload_v3(
         self,
@@ -393,7 +526,7 @@ class NocoDBRequestsClient(NocoDBClient):
             "filename": filename
         }
 
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     # =========================================================================
     # v3 Meta API Methods
@@ -415,7 +548,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"workspaces": [{"id": "ws_abc", "title": "My Workspace"}]}
         """
         url = self.__api_info.get_workspaces_uri()
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def bases_list_v3(
         self,
@@ -439,7 +572,7 @@ class NocoDBRequestsClient(NocoDBClient):
         """
         # Use v2 API - v3 bases list is Enterprise-only
         url = self.__api_info.get_bases_list_uri_v2()
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def bases_list(
         self,
@@ -460,7 +593,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "...", "title": "...", ...}]}
         """
         url = self.__api_info.get_bases_list_uri_v2()
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def base_create(
         self,
@@ -481,7 +614,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"id": "base_abc", "title": "My New Base", ...}
         """
         url = self.__api_info.get_base_create_uri_v2()
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def base_read(
         self,
@@ -498,7 +631,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Base object with id, title, tables, etc.
         """
         url = self.__api_info.get_base_uri(base_id)
-        return self._request("GET", url).json()
+        return self._request_json("GET", url)
 
     def base_update(
         self,
@@ -517,7 +650,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated base object
         """
         url = self.__api_info.get_base_uri(base_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def base_delete(
         self,
@@ -534,7 +667,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_base_uri(base_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     def tables_list_v3(
         self,
@@ -554,7 +687,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "tbl_abc", "title": "My Table"}]}
         """
         url = self.__api_info.get_tables_uri(base_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def table_create_v3(
         self,
@@ -574,7 +707,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created table object with id, title, etc.
         """
         url = self.__api_info.get_tables_uri(base_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def table_read_v3(
         self,
@@ -595,7 +728,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Table object with id, title, columns, etc.
         """
         url = self.__api_info.get_table_meta_uri_v3(base_id, table_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def table_update_v3(
         self,
@@ -616,7 +749,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated table object
         """
         url = self.__api_info.get_table_meta_uri_v3(base_id, table_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def table_delete_v3(
         self,
@@ -635,7 +768,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_table_meta_uri_v3(base_id, table_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # =========================================================================
     # v3 Meta API Methods - Fields
@@ -686,7 +819,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created field object with id, title, type, etc.
         """
         url = self.__api_info.get_fields_uri(base_id, table_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def field_read_v3(
         self,
@@ -706,7 +839,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"id": "fld_abc", "title": "Name", "type": "SingleLineText"}
         """
         url = self.__api_info.get_field_uri(base_id, field_id)
-        return self._request("GET", url).json()
+        return self._request_json("GET", url)
 
     def field_update_v3(
         self,
@@ -727,7 +860,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated field object
         """
         url = self.__api_info.get_field_uri(base_id, field_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def field_delete_v3(
         self,
@@ -746,7 +879,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_field_uri(base_id, field_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     def column_update_v2(
         self,
@@ -768,7 +901,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated column object
         """
         url = self.__api_info.get_column_uri_v2(column_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     # =========================================================================
     # Backwards Compatibility Aliases (column -> field)
@@ -886,7 +1019,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "vw_abc", "title": "Grid View", "type": 3}]}
         """
         url = self.__api_info.get_views_uri(table_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     # Note: view_create and view_read are not supported in self-hosted NocoDB v2 API
 
@@ -909,7 +1042,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated view object
         """
         url = self.__api_info.get_view_uri(view_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def view_delete(
         self,
@@ -928,7 +1061,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_view_uri(view_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # =========================================================================
     # v2 Meta API Methods - View Sorts
@@ -954,7 +1087,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"sorts": [{"id": "srt_abc", "fk_column_id": "fld_123", "direction": "asc"}]}
         """
         url = self.__api_info.get_view_sorts_uri(view_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def view_sort_create(
         self,
@@ -976,7 +1109,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created sort object with id, fk_column_id, direction, etc.
         """
         url = self.__api_info.get_view_sorts_uri(view_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def view_sort_update(
         self,
@@ -997,7 +1130,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated sort object
         """
         url = self.__api_info.get_sort_uri(sort_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def view_sort_delete(
         self,
@@ -1016,7 +1149,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_sort_uri(sort_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # =========================================================================
     # v2 Meta API Methods - View Filters
@@ -1042,7 +1175,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "flt_abc", "fk_column_id": "fld_123", "comparison_op": "eq", "value": "test"}]}
         """
         url = self.__api_info.get_view_filters_uri(view_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def view_filter_create(
         self,
@@ -1072,7 +1205,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created filter object with id, fk_column_id, comparison_op, value, etc.
         """
         url = self.__api_info.get_view_filters_uri(view_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def view_filter_update(
         self,
@@ -1093,7 +1226,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated filter object
         """
         url = self.__api_info.get_filter_uri(filter_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def view_filter_delete(
         self,
@@ -1112,7 +1245,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_filter_uri(filter_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # =========================================================================
     # v2 Meta API Methods - Webhooks
@@ -1138,7 +1271,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "hk_abc", "title": "My Webhook", "event": "after.insert"}]}
         """
         url = self.__api_info.get_webhooks_uri(table_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     # Note: webhook_create, webhook_read, webhook_update are not supported in self-hosted NocoDB v2 API
 
@@ -1159,7 +1292,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_webhook_uri(hook_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # Note: webhook_test is not supported in self-hosted NocoDB v2 API
 
@@ -1185,7 +1318,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"members": [{"id": "usr_abc", "email": "user@example.com", "roles": "editor"}]}
         """
         url = self.__api_info.get_base_members_uri(base_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def base_member_add(
         self,
@@ -1206,7 +1339,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created member object
         """
         url = self.__api_info.get_base_members_uri(base_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def base_member_update(
         self,
@@ -1228,7 +1361,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated member object
         """
         url = self.__api_info.get_base_member_uri(base_id, member_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def base_member_remove(
         self,
@@ -1247,7 +1380,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_base_member_uri(base_id, member_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # =========================================================================
     # v2 Export API Methods
@@ -1378,7 +1511,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "col_abc", "fk_column_id": "fld_123", "show": true, "order": 1}]}
         """
         url = self.__api_info.get_view_columns_uri(view_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def view_column_create(
         self,
@@ -1398,7 +1531,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created view column object
         """
         url = self.__api_info.get_view_columns_uri(view_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def view_column_update(
         self,
@@ -1419,7 +1552,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Updated view column object
         """
         url = self.__api_info.get_view_column_uri(view_id, column_id)
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def view_columns_hide_all(
         self,
@@ -1436,7 +1569,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Operation confirmation
         """
         url = self.__api_info.get_view_hide_all_uri(view_id)
-        return self._request("POST", url).json()
+        return self._request_json("POST", url)
 
     def view_columns_show_all(
         self,
@@ -1453,7 +1586,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Operation confirmation
         """
         url = self.__api_info.get_view_show_all_uri(view_id)
-        return self._request("POST", url).json()
+        return self._request_json("POST", url)
 
     # =========================================================================
     # v2 Shared Views API Methods
@@ -1477,7 +1610,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Example: {"list": [{"id": "sv_abc", "fk_view_id": "vw_123", "uuid": "..."}]}
         """
         url = self.__api_info.get_shared_views_uri(table_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def shared_view_create(
         self,
@@ -1500,7 +1633,7 @@ class NocoDBRequestsClient(NocoDBClient):
         body = {}
         if password:
             body["password"] = password
-        return self._request("POST", url, json=body if body else None).json()
+        return self._request_json("POST", url, json=body if body else None)
 
     def shared_view_update(
         self,
@@ -1520,7 +1653,7 @@ class NocoDBRequestsClient(NocoDBClient):
         """
         url = self.__api_info.get_shared_view_uri(view_id)
         body = {"password": password}
-        return self._request("PATCH", url, json=body).json()
+        return self._request_json("PATCH", url, json=body)
 
     def shared_view_delete(
         self,
@@ -1537,7 +1670,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Deletion confirmation
         """
         url = self.__api_info.get_shared_view_uri(view_id)
-        return self._request("DELETE", url).json()
+        return self._request_json("DELETE", url)
 
     # =========================================================================
     # v2 Storage API Methods
@@ -1546,7 +1679,7 @@ class NocoDBRequestsClient(NocoDBClient):
     def storage_upload(
         self,
         filename: str,
-        content: bytes,
+        content: Union[bytes, BinaryIO],
         content_type: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Upload a file to NocoDB storage.
@@ -1558,35 +1691,30 @@ class NocoDBRequestsClient(NocoDBClient):
 
         Args:
             filename: The filename for the uploaded file
-            content: The file content as bytes
+            content: The file content as bytes, or a binary file object.
+                Passing an open file (e.g. open(path, "rb")) avoids holding
+                a separate copy of the file in memory next to the request body.
             content_type: Optional MIME type (auto-detected if not provided)
 
         Returns:
             Uploaded file metadata with URL
             Example: {"url": "https://...", "title": "file.pdf", "mimetype": "application/pdf"}
         """
-        import mimetypes as mt
-
         url = self.__api_info.get_storage_upload_uri()
 
         if content_type is None:
-            detected_type, _ = mt.guess_type(filename)
-            content_type = detected_type or "application/octet-stream"
+            content_type = _guess_content_type(filename)
 
         # Use multipart form upload
         files = {
             "file": (filename, content, content_type)
         }
 
-        # Use requests.post directly instead of session to avoid
-        # Content-Type: application/json header interfering with multipart boundary
-        # Only include auth header, let requests auto-generate multipart Content-Type
-        auth_headers = {
-            k: v for k, v in self.__session.headers.items()
-            if k.lower() != "content-type"
-        }
-
-        response = requests.post(url, files=files, headers=auth_headers)
+        # Go through the session so uploads reuse its pooled connections and
+        # verify_ssl setting. A None value drops the session's JSON
+        # Content-Type for this request, so requests generates the multipart
+        # Content-Type with its boundary.
+        response = self.__session.post(url, files=files, headers={"Content-Type": None})
         response.raise_for_status()
         return response.json()
 
@@ -1609,7 +1737,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Filter object with id, fk_column_id, comparison_op, value, etc.
         """
         url = self.__api_info.get_filter_uri(filter_id)
-        return self._request("GET", url).json()
+        return self._request_json("GET", url)
 
     def view_sort_get(
         self,
@@ -1626,7 +1754,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Sort object with id, fk_column_id, direction, etc.
         """
         url = self.__api_info.get_sort_uri(sort_id)
-        return self._request("GET", url).json()
+        return self._request_json("GET", url)
 
     def view_filter_children(
         self,
@@ -1645,7 +1773,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Dict with nested filters list
         """
         url = self.__api_info.get_filter_children_uri(filter_group_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     # =========================================================================
     # v2 Webhook Filters/Logs API Methods
@@ -1668,7 +1796,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Dict with webhook filters list
         """
         url = self.__api_info.get_webhook_filters_uri(hook_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def webhook_filter_create(
         self,
@@ -1688,7 +1816,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Created webhook filter object
         """
         url = self.__api_info.get_webhook_filters_uri(hook_id)
-        return self._request("POST", url, json=body).json()
+        return self._request_json("POST", url, json=body)
 
     def webhook_logs(
         self,
@@ -1707,7 +1835,7 @@ class NocoDBRequestsClient(NocoDBClient):
             Dict with webhook execution logs
         """
         url = self.__api_info.get_webhook_logs_uri(hook_id)
-        return self._request("GET", url, params=params).json()
+        return self._request_json("GET", url, params=params)
 
     def webhook_sample_payload(
         self,
@@ -1730,4 +1858,4 @@ class NocoDBRequestsClient(NocoDBClient):
             Sample webhook payload structure
         """
         url = self.__api_info.get_webhook_sample_payload_uri(table_id, event, operation, version)
-        return self._request("GET", url).json()
+        return self._request_json("GET", url)
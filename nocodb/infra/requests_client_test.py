@@ -5,7 +5,7 @@ import json
 import pytest
 import requests
 
-from .requests_client import NocoDBRequestsClient, requests as requests_lib
+from .requests_client import NocoDBRequestsClient, _guess_content_type, requests as requests_lib
 from ..exceptions import NocoDBAPIError
 from ..nocodb import APIToken
 
@@ -25,6 +25,35 @@ def test_NocoDBAPIError_raised_on_bad_response(mock_requests_session):
     assert exc_info.value.status_code == 401
 
 
+@mock.patch.object(requests_lib, "Session")
+def test_NocoDBAPIError_includes_error_response_json(mock_requests_session):
+    mock_session = mock.Mock()
+    mock_resp = requests.models.Response()
+    mock_resp.status_code = 400
+    mock_resp._content = b'{"msg": "Invalid field"}'
+    mock_requests_session.return_value = mock_session
+    mock_session.request.return_value = mock_resp
+
+    client = NocoDBRequestsClient(mock.Mock(), "")
+    with pytest.raises(NocoDBAPIError) as exc_info:
+        client._request("GET", "/")
+
+    assert exc_info.value.response_json == {"msg": "Invalid field"}
+
+
+@mock.patch.object(requests_lib, "Session")
+def test_request_does_not_parse_successful_response(mock_requests_session):
+    mock_session = mock.Mock()
+    mock_resp = mock.Mock(spec=requests.models.Response)
+    mock_requests_session.return_value = mock_session
+    mock_session.request.return_value = mock_resp
+
+    client = NocoDBRequestsClient(mock.Mock(), "")
+    assert client._request("GET", "/") is mock_resp
+
+    mock_resp.json.assert_not_called()
+
+
 # =========================================================================
 # v3 API Tests
 # =========================================================================
@@ -35,10 +64,45 @@ def _create_mock_response(status_code: int, json_data: dict):
     mock_resp = mock.Mock(spec=requests.models.Response)
     mock_resp.status_code = status_code
     mock_resp.json.return_value = json_data
+    mock_resp.content = json.dumps(json_data).encode()
     mock_resp.raise_for_status = mock.Mock()
     return mock_resp
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+@mock.patch.object(requests_lib, "Session")
+def test_request_json_parses_body_with_or_without_orjson(mock_requests_session, use_orjson):
+    """Test that responses decode the same whether or not orjson is installed."""
+    from . import requests_client
+
+    mock_session = mock.Mock()
+    mock_requests_session.return_value = mock_session
+    mock_resp = _create_mock_response(200, {})
+    mock_resp.content = b'{"records": [{"id": 1, "fields": {"Name": "\xc3\xa9"}}]}'
+    mock_resp.json.side_effect = lambda: json.loads(mock_resp.content)
+    mock_session.request.return_value = mock_resp
+
+    client = NocoDBRequestsClient(APIToken("test-token"), "https://app.nocodb.com")
+    with mock.patch.object(requests_client, "orjson", requests_client.orjson if use_orjson else None):
+        result = client.records_list_v3("base123", "tbl456")
+
+    assert result == {"records": [{"id": 1, "fields": {"Name": "\u00e9"}}]}
+
+
+@mock.patch.object(requests_lib, "Session")
+def test_request_json_falls_back_when_orjson_rejects_body(mock_requests_session):
+    """Test that bodies orjson cannot parse are handed to response.json()."""
+    mock_session = mock.Mock()
+    mock_requests_session.return_value = mock_session
+    mock_resp = _create_mock_response(200, {"count": 1})
+    mock_resp.content = b""
+    mock_session.request.return_value = mock_resp
+
+    client = NocoDBRequestsClient(APIToken("test-token"), "https://app.nocodb.com")
+
+    assert client.records_count_v3("base123", "tbl456") == {"count": 1}
+
+
 @mock.patch.object(requests_lib, "Session")
 def test_records_list_v3_calls_correct_url(mock_requests_session):
     """Test that records_list_v3 calls the correct v3 API endpoint."""
@@ -80,6 +144,31 @@ def test_records_list_v3_with_params(mock_requests_session):
     assert call_args[1]["params"] == params
 
 
+@mock.patch.object(requests_lib, "Session")
+def test_records_iter_v3_fetches_pages_lazily(mock_requests_session):
+    """Test that records_iter_v3 only requests the next page when it is needed."""
+    mock_session = mock.Mock()
+    mock_requests_session.return_value = mock_session
+
+    mock_session.request.side_effect = [
+        _create_mock_response(200, {"records": [{"id": 1}], "next": "page2"}),
+        _create_mock_response(200, {"records": [{"id": 2}]}),
+    ]
+
+    token = APIToken("test-token")
+    client = NocoDBRequestsClient(token, "https://app.nocodb.com")
+
+    params = {"pageSize": 1}
+    records = client.records_iter_v3("base123", "tbl456", params=params)
+
+    assert next(records) == {"id": 1}
+    assert mock_session.request.call_count == 1
+    assert list(records) == [{"id": 2}]
+    assert mock_session.request.call_count == 2
+    assert mock_session.request.call_args[1]["params"] == {"pageSize": 1, "page": 2}
+    assert params == {"pageSize": 1}
+
+
 @mock.patch.object(requests_lib, "Session")
 def test_record_get_v3_calls_correct_url(mock_requests_session):
     """Test that record_get_v3 calls the correct v3 API endpoint."""
@@ -100,6 +189,68 @@ def test_record_get_v3_calls_correct_url(mock_requests_session):
     assert result == expected_response
 
 
+@mock.patch.object(requests_lib, "Session")
+def test_record_get_v3_passes_fields_param(mock_requests_session):
+    """Test that record_get_v3 lets the server select fields."""
+    mock_session = mock.Mock()
+    mock_requests_session.return_value = mock_session
+    mock_session.request.return_value = _create_mock_response(200, {"id": 42, "fields": {}})
+
+    token = APIToken("test-token")
+    client = NocoDBRequestsClient(token, "https://app.nocodb.com")
+
+    client.record_get_v3("base123", "tbl456", 42, params={"fields": "Name,Status"})
+
+    assert mock_session.request.call_args[1]["params"] == {"fields": "Name,Status"}
+
+
+@mock.patch.object(requests_lib, "Session")
+def test_records_get_many_v3_keeps_input_order(mock_requests_session):
+    """Test that records_get_many_v3 returns one record per ID, in order."""
+    mock_session = mock.Mock()
+    mock_requests_session.return_value = mock_session
+
+    def respond(method, url, *args, **kwargs):
+        record_id = url.rsplit("/", 1)[-1]
+        return _create_mock_response(200, {"id": record_id, "fields": {}})
+
+    mock_session.request.side_effect = respond
+
+    token = APIToken("test-token")
+    client = NocoDBRequestsClient(token, "https://app.nocodb.com")
+
+    result = client.records_get_many_v3("base123", "tbl456", [str(i) for i in range(10)])
+
+    assert [r["id"] for r in result] == [str(i) for i in range(10)]
+    assert mock_session.request.call_count == 10
+
+
+@mock.patch.object(requests_lib, "Session")
+def test_records_get_many_v3_raises_first_error_after_fetching_the_rest(mock_requests_session):
+    """Test that a failed fetch is raised once every other ID has been fetched."""
+    mock_session = mock.Mock()
+    mock_requests_session.return_value = mock_session
+
+    def respond(method, url, *args, **kwargs):
+        record_id = url.rsplit("/", 1)[-1]
+        if record_id == "2":
+            not_found = requests.models.Response()
+            not_found.status_code = 404
+            return not_found
+        return _create_mock_response(200, {"id": record_id, "fields": {}})
+
+    mock_session.request.side_effect = respond
+
+    token = APIToken("test-token")
+    client = NocoDBRequestsClient(token, "https://app.nocodb.com")
+
+    with pytest.raises(NocoDBAPIError) as exc_info:
+        client.records_get_many_v3("base123", "tbl456", ["1", "2", "3"])
+
+    assert exc_info.value.status_code == 404
+    assert mock_session.request.call_count == 3
+
+
 @mock.patch.object(requests_lib, "Session")
 def test_records_create_v3_single_record(mock_requests_session):
     """Test that records_create_v3 handles single record creation."""
@@ -1731,3 +1882,41 @@ def test_webhook_delete_calls_correct_url(mock_requests_session):
     assert call_args[0][0] == "DELETE"
     assert "/api/v2/meta/hooks/hk_abc" in call_args[0][1]
     assert result == expected_response
+
+
+# =========================================================================
+# Storage Upload Tests
+# =========================================================================
+
+
+@mock.patch.object(requests_lib, "Session")
+def test_storage_upload_accepts_file_object(mock_requests_session, tmp_path):
+    """Test that storage_upload passes a file object through to the multipart body."""
+    mock_session = mock.Mock()
+    mock_session.headers = {"xc-token": "test-token", "Content-Type": "application/json"}
+    mock_requests_session.return_value = mock_session
+    mock_session.post.return_value = _create_mock_response(200, {"url": "https://x/doc.pdf"})
+
+    client = NocoDBRequestsClient(APIToken("test-token"), "https://app.nocodb.com")
+
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    with open(path, "rb") as f:
+        result = client.storage_upload("doc.pdf", f)
+        sent = mock_session.post.call_args[1]["files"]["file"]
+        assert sent[0] == "doc.pdf"
+        assert sent[1] is f
+        assert sent[2] == "application/pdf"
+
+    # Upload goes through the shared session with the JSON Content-Type removed
+    assert mock_session.post.call_args[1]["headers"] == {"Content-Type": None}
+    assert result == {"url": "https://x/doc.pdf"}
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ("photo.JPG", "image/jpeg"),
+    ("archive.tar.gz", "application/x-tar"),
+    ("data.unknownext", "application/octet-stream"),
+])
+def test_guess_content_type(filename, expected):
+    assert _guess_content_type(filename) == expected
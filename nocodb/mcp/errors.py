@@ -1,11 +1,15 @@
 """Error handling utilities for NocoDB MCP server."""
 
+import inspect
 from typing import Callable, TypeVar, ParamSpec
 from functools import wraps
 
 from fastmcp.exceptions import ToolError
 
 from nocodb.exceptions import NocoDBAPIError
+from nocodb.utils import run_each
+
+from .models import BulkDeleteResult
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -22,45 +26,96 @@ def wrap_api_error(func: Callable[P, T]) -> Callable[P, T]:
         try:
             return func(*args, **kwargs)
         except NocoDBAPIError as e:
-            # Extract useful error details
-            details = []
-            if e.status_code:
-                details.append(f"Status: {e.status_code}")
-            if e.response_json:
-                msg = e.response_json.get("msg") or e.response_json.get("message")
-                if msg:
-                    details.append(f"Message: {msg}")
+            raise ToolError(format_error(e)) from e
+
+    return wrapper
 
-            error_msg = str(e)
-            if details:
-                error_msg = f"{error_msg} ({', '.join(details)})"
 
-            raise ToolError(error_msg) from e
+def format_error(error: Exception) -> str:
+    """Describe an error for an MCP client, with API status and message when known."""
+    error_msg = str(error)
+    if not isinstance(error, NocoDBAPIError):
+        return error_msg
 
-    return wrapper
+    # Extract useful error details
+    details = []
+    if error.status_code:
+        details.append(f"Status: {error.status_code}")
+    if error.response_json:
+        msg = error.response_json.get("msg") or error.response_json.get("message")
+        if msg:
+            details.append(f"Message: {msg}")
 
+    if details:
+        error_msg = f"{error_msg} ({', '.join(details)})"
+    return error_msg
 
-def require_confirm(operation: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+
+def require_confirm(
+    operation: str,
+    detail: str = "This is a destructive operation that cannot be undone.",
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator to require confirm=True for destructive operations.
 
     Args:
         operation: Description of the destructive operation (e.g., "delete records")
+        detail: Extra sentence appended to the error message (empty to omit)
 
     Usage:
         @require_confirm("delete records")
         def records_delete(table_id: str, record_ids: list[str], confirm: bool = False):
             ...
     """
+    message = f"Set confirm=True to {operation}."
+    if detail:
+        message = f"{message} {detail}"
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        signature = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Check for confirm in kwargs
-            confirm = kwargs.get("confirm", False)
-            if not confirm:
-                raise ToolError(
-                    f"Set confirm=True to {operation}. "
-                    f"This is a destructive operation that cannot be undone."
-                )
+            # Bind so confirm is found whether passed by keyword or position
+            bound = signature.bind(*args, **kwargs)
+            if not bound.arguments.get("confirm", False):
+                raise ToolError(message)
             return func(*args, **kwargs)
         return wrapper
     return decorator
+
+
+def delete_each(delete_fn: Callable[[str], object], ids: list[str], noun: str) -> BulkDeleteResult:
+    """Delete each ID concurrently and report which deletes went through.
+
+    If every delete failed nothing was removed, so the first error is raised
+    as usual. If only some failed, the result lists the deleted IDs and each
+    failed ID with its error so the caller can retry exactly those.
+
+    Args:
+        delete_fn: Deletes one ID (e.g., client.view_delete)
+        ids: The IDs to delete
+        noun: What is being deleted, for the message (e.g., "view")
+    """
+    outcome = run_each(delete_fn, ids)
+    if not outcome.failures:
+        return BulkDeleteResult(
+            success=True,
+            message=f"Deleted {len(outcome.succeeded)} {noun}(s)",
+            deleted=outcome.succeeded,
+        )
+
+    if not outcome.succeeded:
+        raise outcome.failures[0].error
+
+    return BulkDeleteResult(
+        success=False,
+        message=(
+            f"Deleted {len(outcome.succeeded)} {noun}(s); {len(outcome.failures)} "
+            f"failed and were not deleted (see failed)"
+        ),
+        deleted=outcome.succeeded,
+        failed=[
+            {"id": failure.item, "error": format_error(failure.error)}
+            for failure in outcome.failures
+        ],
+    )
@@ -0,0 +1,25 @@
+"""Tests for the MCP error-handling decorators."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from .errors import require_confirm
+
+
+@require_confirm("drop the thing")
+def _drop(thing_id: str, confirm: bool = False) -> str:
+    return f"dropped {thing_id}"
+
+
+def test_require_confirm_accepts_keyword_and_positional_confirm():
+    assert _drop("t1", confirm=True) == "dropped t1"
+    assert _drop("t1", True) == "dropped t1"
+
+
+@pytest.mark.parametrize("args, kwargs", [
+    (("t1",), {}),
+    (("t1", False), {}),
+    (("t1",), {"confirm": False}),
+])
+def test_require_confirm_rejects_unconfirmed_calls(args, kwargs):
+    with pytest.raises(ToolError, match="Set confirm=True to drop the thing"):
+        _drop(*args, **kwargs)
@@ -36,10 +36,16 @@ class RecordsCountResult:
 
 @dataclass
 class RecordsMutationResult:
-    """Result from creating/updating/deleting records."""
+    """Result from creating/updating/deleting records.
+
+    When some batches of a multi-batch create/delete fail, success is False,
+    records holds what was applied and failed_batches lists each batch that
+    was not: {"start": index of its first item, "items": [...], "error": "..."}.
+    """
     success: bool
     records: list[dict[str, Any]] = field(default_factory=list)
     message: str = ""
+    failed_batches: list[dict[str, Any]] = field(default_factory=list)
 
 
 # =============================================================================
@@ -362,3 +368,20 @@ class BaseSchemaResult:
     title: str
     tables: list[dict[str, Any]]
     description: str | None = None
+
+
+# =============================================================================
+# Bulk Deletes
+# =============================================================================
+
+@dataclass
+class BulkDeleteResult:
+    """Result from deleting several views, filters, sorts or webhooks by ID.
+
+    When some deletes fail, success is False, deleted lists the IDs that
+    were removed and failed lists the rest as {"id": "...", "error": "..."}.
+    """
+    success: bool
+    message: str = ""
+    deleted: list[str] = field(default_factory=list)
+    failed: list[dict[str, Any]] = field(default_factory=list)
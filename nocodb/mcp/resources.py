@@ -178,6 +178,7 @@ records_list(table_id="tbl_xxx", where="(status,eq,Active)")  # Guessing "status
 | `views_list` | List views for a table |
 | `view_update` | Update view title/icon |
 | `view_delete` | Delete view (**confirm=True required**) |
+| `views_delete` | Delete several views concurrently (**confirm=True required**) |
 
 ### View Filters & Sorts
 | Tool | Description |
@@ -186,10 +187,12 @@ records_list(table_id="tbl_xxx", where="(status,eq,Active)")  # Guessing "status
 | `view_filter_create` | Create filter |
 | `view_filter_update` | Update filter |
 | `view_filter_delete` | Delete filter (**confirm=True required**) |
+| `view_filters_delete` | Delete several filters concurrently (**confirm=True required**) |
 | `view_sorts_list` | List view sorts |
 | `view_sort_create` | Create sort |
 | `view_sort_update` | Update sort |
 | `view_sort_delete` | Delete sort (**confirm=True required**) |
+| `view_sorts_delete` | Delete several sorts concurrently (**confirm=True required**) |
 
 ### View Columns & Sharing
 | Tool | Description |
@@ -208,6 +211,7 @@ records_list(table_id="tbl_xxx", where="(status,eq,Active)")  # Guessing "status
 |------|-------------|
 | `webhooks_list` | List webhooks for table |
 | `webhook_delete` | Delete webhook (**confirm=True required**) |
+| `webhooks_delete` | Delete several webhooks concurrently (**confirm=True required**) |
 | `webhook_logs` | View webhook execution logs |
 | `webhook_sample_payload` | Get sample payload |
 | `webhook_filters_list` | List webhook filters |
@@ -388,10 +392,14 @@ All destructive operations require `confirm=True`:
 - `table_delete`
 - `field_delete`
 - `view_delete`
+- `views_delete`
 - `view_filter_delete`
+- `view_filters_delete`
 - `view_sort_delete`
+- `view_sorts_delete`
 - `shared_view_delete`
 - `webhook_delete`
+- `webhooks_delete`
 - `member_remove`
 - `linked_records_unlink`
 
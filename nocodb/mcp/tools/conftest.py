@@ -0,0 +1,21 @@
+"""Shared fixtures for the MCP tool tests."""
+from unittest import mock
+
+import pytest
+
+
+@pytest.fixture
+def patch_client(monkeypatch):
+    """Return a function that stubs a tool module's client with a Mock.
+
+    Call it with the module under test; it patches get_client (and
+    get_base_id, returning "base123", where the module uses it) and returns
+    the Mock client so tests can set responses and assert calls.
+    """
+    def patch(module):
+        client = mock.Mock()
+        monkeypatch.setattr(module, "get_client", lambda: client)
+        if hasattr(module, "get_base_id"):
+            monkeypatch.setattr(module, "get_base_id", lambda: "base123")
+        return client
+    return patch
@@ -11,9 +11,11 @@ Provides CRUD operations for table fields (columns):
 
 from typing import Optional, Any
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client, get_base_id
-from ..errors import wrap_api_error
+from ..errors import wrap_api_error, require_confirm
 from ..models import FieldsListResult, FieldResult, FieldDeleteResult
 
 
@@ -56,7 +58,7 @@ def field_get(field_id: str) -> FieldResult:
     return FieldResult(
         id=result.get("id", field_id),
         title=result.get("title", ""),
-        type=result.get("uidt", result.get("type", "")),
+        type=result["uidt"] if "uidt" in result else result.get("type", ""),
         options=result.get("colOptions") or result.get("options"),
     )
 
@@ -124,7 +126,7 @@ def field_create(
     return FieldResult(
         id=result.get("id", ""),
         title=result.get("title", title),
-        type=result.get("uidt", result.get("type", field_type)),
+        type=result["uidt"] if "uidt" in result else result.get("type", field_type),
         options=result.get("colOptions") or result.get("options"),
     )
 
@@ -148,25 +150,21 @@ def field_update(
     Returns:
         FieldResult with updated field details.
     """
-    client = get_client()
-    base_id = get_base_id()
-
-    body: dict[str, Any] = {}
-    if title is not None:
-        body["title"] = title
-    if options is not None:
-        body["options"] = options
+    body = drop_none(title=title, options=options)
 
     if not body:
         from fastmcp.exceptions import ToolError
         raise ToolError("At least one field (title or options) must be provided")
 
+    client = get_client()
+    base_id = get_base_id()
+
     result = client.field_update_v3(base_id, field_id, body)
 
     return FieldResult(
         id=result.get("id", field_id),
         title=result.get("title", ""),
-        type=result.get("uidt", result.get("type", "")),
+        type=result["uidt"] if "uidt" in result else result.get("type", ""),
         options=result.get("colOptions") or result.get("options"),
     )
 
@@ -207,7 +205,7 @@ def field_update_options(
     return FieldResult(
         id=result.get("id", field_id),
         title=result.get("title", ""),
-        type=result.get("uidt", result.get("type", "")),
+        type=result["uidt"] if "uidt" in result else result.get("type", ""),
         options=result.get("colOptions") or result.get("options"),
     )
 
@@ -218,6 +216,10 @@ def field_update_options(
     "idempotentHint": False,
 })
 @wrap_api_error
+@require_confirm(
+    "delete this field",
+    "This permanently deletes the field and all its data across all records.",
+)
 def field_delete(
     field_id: str,
     confirm: bool = False,
@@ -234,13 +236,6 @@ def field_delete(
     Returns:
         FieldDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete this field. "
-            "This permanently deletes the field and all its data across all records."
-        )
-
     client = get_client()
     base_id = get_base_id()
 
@@ -8,9 +8,11 @@ Provides operations for linked records (relationships):
 
 from typing import Optional
 
+from nocodb.utils import run_batches
+
 from ..server import mcp
 from ..dependencies import get_client, get_base_id
-from ..errors import wrap_api_error
+from ..errors import wrap_api_error, require_confirm
 from ..models import LinkedRecordsResult
 
 
@@ -60,7 +62,7 @@ def linked_records_list(
     # Response format varies by relationship type
     # hm (has many): {"list": [...]} or {"records": [...]}
     # bt (belongs to): {"record": {...}} (singular)
-    records = result.get("records", result.get("list", []))
+    records = result["records"] if "records" in result else result.get("list", [])
     if isinstance(records, dict):
         # belongs_to returns single record
         records = [records] if records else []
@@ -98,12 +100,15 @@ def linked_records_link(
     client = get_client()
     base_id = get_base_id()
 
-    result = client.linked_records_link_v3(
-        base_id, table_id, link_field_id, record_id, target_ids
-    )
+    def link(batch: list[str]) -> list[dict]:
+        result = client.linked_records_link_v3(
+            base_id, table_id, link_field_id, record_id, batch
+        )
+        # Result is list of {"id": ...} for linked records
+        return result if isinstance(result, list) else []
 
-    # Result is list of {"id": ...} for linked records
-    records = result if isinstance(result, list) else []
+    # Large target lists are split into batches sent concurrently
+    records = run_batches(link, target_ids)
 
     return LinkedRecordsResult(records=records)
 
@@ -114,6 +119,10 @@ def linked_records_link(
     "idempotentHint": True,
 })
 @wrap_api_error
+@require_confirm(
+    "unlink records",
+    "This removes the relationship but does not delete the records.",
+)
 def linked_records_unlink(
     table_id: str,
     link_field_id: str,
@@ -141,21 +150,17 @@ def linked_records_unlink(
         # Unlink task 2 from project 5
         linked_records_unlink("tbl_projects", "fld_tasks_link", "5", ["2"], confirm=True)
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to unlink records. "
-            "This removes the relationship but does not delete the records."
-        )
-
     client = get_client()
     base_id = get_base_id()
 
-    result = client.linked_records_unlink_v3(
-        base_id, table_id, link_field_id, record_id, target_ids
-    )
+    def unlink(batch: list[str]) -> list[dict]:
+        result = client.linked_records_unlink_v3(
+            base_id, table_id, link_field_id, record_id, batch
+        )
+        # Result is list of {"id": ...} for unlinked records
+        return result if isinstance(result, list) else []
 
-    # Result is list of {"id": ...} for unlinked records
-    records = result if isinstance(result, list) else []
+    # Large target lists are split into batches sent concurrently
+    records = run_batches(unlink, target_ids)
 
     return LinkedRecordsResult(records=records)
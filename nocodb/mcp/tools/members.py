@@ -11,9 +11,20 @@ from typing import Optional
 
 from ..server import mcp
 from ..dependencies import get_client, get_base_id
-from ..errors import wrap_api_error
+from ..errors import wrap_api_error, require_confirm
 from ..models import MembersListResult, MemberResult, MemberDeleteResult
 
+# Roles accepted by the base members API
+_VALID_ROLES = frozenset(("owner", "creator", "editor", "commenter", "viewer"))
+_VALID_ROLES_HELP = "owner, creator, editor, commenter, viewer"
+
+
+def _check_role(role: str) -> None:
+    """Reject unknown roles locally instead of waiting for the API to fail."""
+    if role not in _VALID_ROLES:
+        from fastmcp.exceptions import ToolError
+        raise ToolError(f"Invalid role '{role}'. Valid roles: {_VALID_ROLES_HELP}")
+
 
 @mcp.tool
 @wrap_api_error
@@ -27,7 +38,7 @@ def members_list() -> MembersListResult:
     base_id = get_base_id()
 
     result = client.base_members_list(base_id)
-    members = result.get("members", result.get("list", []))
+    members = result["members"] if "members" in result else result.get("list", [])
 
     return MembersListResult(members=members)
 
@@ -52,6 +63,8 @@ def member_add(
     Returns:
         MemberResult with the added member details.
     """
+    _check_role(role)
+
     client = get_client()
     base_id = get_base_id()
 
@@ -85,6 +98,8 @@ def member_update(
     Returns:
         MemberResult with updated member details.
     """
+    _check_role(role)
+
     client = get_client()
     base_id = get_base_id()
 
@@ -104,6 +119,10 @@ def member_update(
     "idempotentHint": True,
 })
 @wrap_api_error
+@require_confirm(
+    "remove this member",
+    "The user will lose access to this base.",
+)
 def member_remove(
     member_id: str,
     confirm: bool = False,
@@ -120,13 +139,6 @@ def member_remove(
     Returns:
         MemberDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to remove this member. "
-            "The user will lose access to this base."
-        )
-
     client = get_client()
     base_id = get_base_id()
 
@@ -0,0 +1,43 @@
+"""Tests for the members MCP tools."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from . import members
+
+
+@pytest.fixture
+def client(patch_client):
+    return patch_client(members)
+
+
+def test_member_add_accepts_valid_role(client):
+    client.base_member_add.return_value = {"id": "usr1", "email": "a@example.com", "roles": "viewer"}
+
+    result = members.member_add("a@example.com", role="viewer")
+
+    client.base_member_add.assert_called_once_with("base123", {"email": "a@example.com", "roles": "viewer"})
+    assert result.roles == "viewer"
+
+
+@pytest.mark.parametrize("call", [
+    lambda: members.member_add("a@example.com", role="admin"),
+    lambda: members.member_update("usr1", role="admin"),
+])
+def test_invalid_role_is_rejected_before_the_api(client, call):
+    with pytest.raises(ToolError) as exc_info:
+        call()
+
+    assert str(exc_info.value) == (
+        "Invalid role 'admin'. Valid roles: owner, creator, editor, commenter, viewer"
+    )
+    client.base_member_add.assert_not_called()
+    client.base_member_update.assert_not_called()
+
+
+def test_member_update_accepts_valid_role(client):
+    client.base_member_update.return_value = {"id": "usr1", "roles": "editor"}
+
+    result = members.member_update("usr1", role="editor")
+
+    client.base_member_update.assert_called_once_with("base123", "usr1", {"roles": "editor"})
+    assert result.roles == "editor"
@@ -12,9 +12,11 @@ Provides CRUD operations for table records:
 
 from typing import Optional
 
+from nocodb.utils import BatchOutcome, chunked, run_batches_collect
+
 from ..server import mcp
 from ..dependencies import get_client, get_base_id
-from ..errors import wrap_api_error
+from ..errors import format_error, wrap_api_error, require_confirm
 from ..models import (
     RecordsListResult,
     RecordResult,
@@ -22,6 +24,42 @@ from ..models import (
     RecordsMutationResult,
 )
 
+# Records sent per API request for batch create/update/delete
+BATCH_SIZE = 100
+
+
+def _mutation_result(outcome: BatchOutcome, total: int, verb: str) -> RecordsMutationResult:
+    """Report which batches of a create/delete were applied and which were not.
+
+    If every batch failed nothing was applied, so the first error is raised
+    as usual. If only some failed, the result lists the applied records and
+    each failed batch so the caller can retry exactly those items.
+    """
+    if not outcome.failures:
+        return RecordsMutationResult(
+            success=True,
+            records=outcome.results,
+            message=f"{verb} {len(outcome.results)} record(s)",
+        )
+
+    failed_count = sum(len(failure.items) for failure in outcome.failures)
+    if failed_count == total:
+        raise outcome.failures[0].error
+
+    return RecordsMutationResult(
+        success=False,
+        records=outcome.results,
+        message=(
+            f"{verb} {len(outcome.results)} record(s); {len(outcome.failures)} batch(es) "
+            f"with {failed_count} record(s) failed and were not {verb.lower()} "
+            f"(see failed_batches)"
+        ),
+        failed_batches=[
+            {"start": failure.start, "items": list(failure.items), "error": format_error(failure.error)}
+            for failure in outcome.failures
+        ],
+    )
+
 
 @mcp.tool
 @wrap_api_error
@@ -119,12 +157,14 @@ def records_list_all(
 def record_get(
     table_id: str,
     record_id: str,
+    fields: Optional[str] = None,
 ) -> RecordResult:
     """Get a single record by ID.
 
     Args:
         table_id: The table ID (e.g., "tbl_xxx")
         record_id: The record ID (e.g., "1" or "rec_xxx")
+        fields: Comma-separated field names to include (e.g., "Name,Email,Status")
 
     Returns:
         RecordResult with id and fields.
@@ -132,7 +172,8 @@ def record_get(
     client = get_client()
     base_id = get_base_id()
 
-    result = client.record_get_v3(base_id, table_id, record_id)
+    params = {"fields": fields} if fields else None
+    result = client.record_get_v3(base_id, table_id, record_id, params=params)
 
     return RecordResult(
         id=result.get("id"),
@@ -153,24 +194,31 @@ def records_create(
         records: List of record data dicts. Each dict should contain field values.
             Example: [{"Name": "John", "Email": "john@example.com"}]
             For batch: [{"Name": "A"}, {"Name": "B"}, {"Name": "C"}]
+            Large batches are sent in chunks of 100 records, several requests
+            at a time. Returned records keep the input order.
 
     Returns:
-        RecordsMutationResult with created records.
+        RecordsMutationResult with created records. If only some chunks fail,
+        success is False and failed_batches lists the records that were not
+        created, with the error for each chunk.
     """
     client = get_client()
     base_id = get_base_id()
 
-    # Wrap each record in {"fields": ...} format for v3 API
-    formatted = [{"fields": r} for r in records]
-
-    result = client.records_create_v3(base_id, table_id, formatted)
-
-    return RecordsMutationResult(
-        success=True,
-        records=result,
-        message=f"Created {len(result)} record(s)",
+    # Chunks of BATCH_SIZE records, created concurrently. Each record is
+    # wrapped in {"fields": ...} format for v3 API as its chunk is sent.
+    # Creates are not idempotent, so a failed chunk is reported rather than
+    # raised over the chunks that were already created.
+    outcome = run_batches_collect(
+        lambda batch: client.records_create_v3(
+            base_id, table_id, [{"fields": r} for r in batch]
+        ),
+        records,
+        batch_size=BATCH_SIZE,
     )
 
+    return _mutation_result(outcome, len(records), "Created")
+
 
 @mcp.tool
 @wrap_api_error
@@ -192,15 +240,21 @@ def records_update(
     client = get_client()
     base_id = get_base_id()
 
-    # Format records for v3 API: {"id": x, "fields": {...}}
-    formatted = []
-    for r in records:
-        record_id = r.pop("id", None)
-        if record_id is None:
-            raise ValueError("Each record must have an 'id' field")
-        formatted.append({"id": record_id, "fields": r})
-
-    result = client.records_update_v3(base_id, table_id, formatted)
+    # Check every record has an id before sending anything, so a missing id is
+    # reported (with its index) instead of failing partway through. This does not
+    # make the update atomic: a later batch can still fail after earlier ones applied
+    for index, r in enumerate(records):
+        if r.get("id") is None:
+            raise ValueError(f"Each record must have an 'id' field (missing at index {index})")
+
+    result = []
+    for batch in chunked(records, BATCH_SIZE):
+        # Format records for v3 API as they are sent: {"id": x, "fields": {...}}
+        formatted = [
+            {"id": r["id"], "fields": {k: v for k, v in r.items() if k != "id"}}
+            for r in batch
+        ]
+        result.extend(client.records_update_v3(base_id, table_id, formatted))
 
     return RecordsMutationResult(
         success=True,
@@ -215,6 +269,7 @@ def records_update(
     "idempotentHint": False,
 })
 @wrap_api_error
+@require_confirm("delete records")
 def records_delete(
     table_id: str,
     record_ids: list[str],
@@ -230,26 +285,23 @@ def records_delete(
         confirm: Must be True to proceed with deletion
 
     Returns:
-        RecordsMutationResult with deleted record IDs.
+        RecordsMutationResult with deleted record IDs. If only some chunks
+        fail, success is False and failed_batches lists the IDs that were
+        not deleted, with the error for each chunk.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete records. "
-            "This is a destructive operation that cannot be undone."
-        )
-
     client = get_client()
     base_id = get_base_id()
 
-    result = client.records_delete_v3(base_id, table_id, record_ids)
-
-    return RecordsMutationResult(
-        success=True,
-        records=result,
-        message=f"Deleted {len(result)} record(s)",
+    # Chunks of BATCH_SIZE IDs, deleted concurrently; a failed chunk is
+    # reported alongside the IDs that were already deleted
+    outcome = run_batches_collect(
+        lambda batch: client.records_delete_v3(base_id, table_id, batch),
+        record_ids,
+        batch_size=BATCH_SIZE,
     )
 
+    return _mutation_result(outcome, len(record_ids), "Deleted")
+
 
 @mcp.tool
 @wrap_api_error
@@ -0,0 +1,85 @@
+"""Tests for the records MCP tools."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from nocodb.exceptions import NocoDBAPIError
+
+from . import records
+
+
+@pytest.fixture
+def client(patch_client, monkeypatch):
+    monkeypatch.setattr(records, "BATCH_SIZE", 2)
+    return patch_client(records)
+
+
+def _api_error():
+    return NocoDBAPIError(message="500 Server Error", status_code=500, response_json={"msg": "db down"})
+
+
+def test_records_create_reports_failed_chunk(client):
+    def create(base_id, table_id, rows):
+        if rows[0]["fields"]["n"] == 2:
+            raise _api_error()
+        return [{"id": row["fields"]["n"], "fields": row["fields"]} for row in rows]
+
+    client.records_create_v3.side_effect = create
+
+    result = records.records_create("tbl1", [{"n": i} for i in range(5)])
+
+    assert result.success is False
+    assert [r["id"] for r in result.records] == [0, 1, 4]
+    assert result.failed_batches == [{
+        "start": 2,
+        "items": [{"n": 2}, {"n": 3}],
+        "error": "500 Server Error (Status: 500, Message: db down)",
+    }]
+    assert "Created 3 record(s)" in result.message
+
+
+def test_records_create_raises_when_every_chunk_fails(client):
+    client.records_create_v3.side_effect = _api_error()
+
+    with pytest.raises(ToolError, match="db down"):
+        records.records_create("tbl1", [{"n": i} for i in range(3)])
+
+
+def test_records_delete_reports_failed_chunk(client):
+    def delete(base_id, table_id, ids):
+        if "3" in ids:
+            raise _api_error()
+        return [{"id": record_id} for record_id in ids]
+
+    client.records_delete_v3.side_effect = delete
+
+    result = records.records_delete("tbl1", ["1", "2", "3", "4", "5"], confirm=True)
+
+    assert result.success is False
+    assert [r["id"] for r in result.records] == ["1", "2", "5"]
+    assert [(b["start"], b["items"]) for b in result.failed_batches] == [(2, ["3", "4"])]
+    assert result.message.startswith("Deleted 3 record(s); 1 batch(es) with 2 record(s) failed")
+
+
+def test_records_update_rejects_missing_id_before_sending(client):
+    with pytest.raises(ValueError, match="missing at index 2"):
+        records.records_update("tbl1", [{"id": 1}, {"id": 2}, {"Name": "x"}])
+
+    client.records_update_v3.assert_not_called()
+
+
+def test_records_update_sends_batches_in_v3_format(client):
+    client.records_update_v3.side_effect = lambda base_id, table_id, rows: rows
+
+    result = records.records_update("tbl1", [{"id": i, "Status": "Done"} for i in range(3)])
+
+    assert client.records_update_v3.call_count == 2
+    assert result.records[2] == {"id": 2, "fields": {"Status": "Done"}}
+
+
+def test_records_delete_accepts_positional_confirm(client):
+    client.records_delete_v3.return_value = [{"id": "1"}]
+
+    result = records.records_delete("tbl1", ["1"], True)
+
+    assert result.success is True
+    client.records_delete_v3.assert_called_once_with("base123", "tbl1", ["1"])
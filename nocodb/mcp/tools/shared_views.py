@@ -11,7 +11,7 @@ from typing import Optional
 
 from ..server import mcp
 from ..dependencies import get_client
-from ..errors import wrap_api_error
+from ..errors import wrap_api_error, require_confirm
 from ..models import SharedViewsListResult, SharedViewResult, SharedViewDeleteResult
 
 
@@ -94,6 +94,10 @@ def shared_view_update(
     "idempotentHint": True,
 })
 @wrap_api_error
+@require_confirm(
+    "remove public access",
+    "The shared link will stop working.",
+)
 def shared_view_delete(
     view_id: str,
     confirm: bool = False,
@@ -109,13 +113,6 @@ def shared_view_delete(
     Returns:
         SharedViewDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to remove public access. "
-            "The shared link will stop working."
-        )
-
     client = get_client()
 
     client.shared_view_delete(view_id)
@@ -10,9 +10,11 @@ Provides CRUD operations for tables:
 
 from typing import Optional, Any
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client, get_base_id
-from ..errors import wrap_api_error
+from ..errors import wrap_api_error, require_confirm
 from ..models import TablesListResult, TableResult, TableDeleteResult
 
 
@@ -127,21 +129,15 @@ def table_update(
     Returns:
         TableResult with updated table details.
     """
-    client = get_client()
-    base_id = get_base_id()
-
-    body: dict[str, Any] = {}
-    if title is not None:
-        body["title"] = title
-    if icon is not None:
-        body["icon"] = icon
-    if meta is not None:
-        body["meta"] = meta
+    body = drop_none(title=title, icon=icon, meta=meta)
 
     if not body:
         from fastmcp.exceptions import ToolError
         raise ToolError("At least one field (title, icon, or meta) must be provided")
 
+    client = get_client()
+    base_id = get_base_id()
+
     result = client.table_update_v3(base_id, table_id, body)
 
     return TableResult(
@@ -158,6 +154,10 @@ def table_update(
     "idempotentHint": False,
 })
 @wrap_api_error
+@require_confirm(
+    "delete this table",
+    "This permanently deletes the table and ALL its records.",
+)
 def table_delete(
     table_id: str,
     confirm: bool = False,
@@ -174,13 +174,6 @@ def table_delete(
     Returns:
         TableDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete this table. "
-            "This permanently deletes the table and ALL its records."
-        )
-
     client = get_client()
     base_id = get_base_id()
 
@@ -9,6 +9,8 @@ Provides operations for view column visibility:
 
 from typing import Optional
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client
 from ..errors import wrap_api_error
@@ -53,18 +55,14 @@ def view_column_update(
     Returns:
         ViewColumnResult with updated column settings.
     """
-    client = get_client()
-
-    body = {}
-    if show is not None:
-        body["show"] = show
-    if order is not None:
-        body["order"] = order
+    body = drop_none(show=show, order=order)
 
     if not body:
         from fastmcp.exceptions import ToolError
         raise ToolError("At least one field (show or order) must be provided")
 
+    client = get_client()
+
     result = client.view_column_update(view_id, column_id, body)
 
     return ViewColumnResult(
@@ -6,15 +6,18 @@ Provides CRUD operations for view filters:
 - view_filter_create: Create a new filter
 - view_filter_update: Update a filter
 - view_filter_delete: Delete a filter (requires confirm=True)
+- view_filters_delete: Delete several filters at once (requires confirm=True)
 - view_filter_children: Get children of a filter group
 """
 
 from typing import Optional, Any
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client
-from ..errors import wrap_api_error
-from ..models import ViewFiltersListResult, ViewFilterResult, ViewFilterDeleteResult
+from ..errors import wrap_api_error, require_confirm, delete_each
+from ..models import ViewFiltersListResult, ViewFilterResult, ViewFilterDeleteResult, BulkDeleteResult
 
 
 @mcp.tool
@@ -137,20 +140,14 @@ def view_filter_update(
     Returns:
         ViewFilterResult with updated filter details.
     """
-    client = get_client()
-
-    body: dict[str, Any] = {}
-    if fk_column_id is not None:
-        body["fk_column_id"] = fk_column_id
-    if comparison_op is not None:
-        body["comparison_op"] = comparison_op
-    if value is not None:
-        body["value"] = value
+    body = drop_none(fk_column_id=fk_column_id, comparison_op=comparison_op, value=value)
 
     if not body:
         from fastmcp.exceptions import ToolError
         raise ToolError("At least one field must be provided to update")
 
+    client = get_client()
+
     result = client.view_filter_update(filter_id, body)
 
     return ViewFilterResult(
@@ -167,6 +164,7 @@ def view_filter_update(
     "idempotentHint": True,
 })
 @wrap_api_error
+@require_confirm("delete this filter", "")
 def view_filter_delete(
     filter_id: str,
     confirm: bool = False,
@@ -180,12 +178,6 @@ def view_filter_delete(
     Returns:
         ViewFilterDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete this filter."
-        )
-
     client = get_client()
 
     client.view_filter_delete(filter_id)
@@ -196,6 +188,35 @@ def view_filter_delete(
     )
 
 
+@mcp.tool(annotations={
+    "title": "Delete Filters",
+    "destructiveHint": True,
+    "idempotentHint": True,
+})
+@wrap_api_error
+@require_confirm("delete these filters", "")
+def view_filters_delete(
+    filter_ids: list[str],
+    confirm: bool = False,
+) -> BulkDeleteResult:
+    """Delete several filters in one call.
+
+    The DELETE requests are sent concurrently, so tearing down many filters
+    costs about one round-trip instead of one per filter. If only some of
+    them fail, success is False and the result lists the deleted and failed IDs.
+
+    Args:
+        filter_ids: The filter IDs (e.g., ["flt_xxx", "flt_yyy"])
+        confirm: Must be True to proceed with deletion
+
+    Returns:
+        BulkDeleteResult with the deleted and failed filter IDs.
+    """
+    client = get_client()
+
+    return delete_each(client.view_filter_delete, filter_ids, "filter")
+
+
 @mcp.tool
 @wrap_api_error
 def view_filter_children(filter_group_id: str) -> ViewFiltersListResult:
@@ -212,6 +233,6 @@ def view_filter_children(filter_group_id: str) -> ViewFiltersListResult:
     client = get_client()
 
     result = client.view_filter_children(filter_group_id)
-    filters = result.get("list", result.get("children", []))
+    filters = result["list"] if "list" in result else result.get("children", [])
 
     return ViewFiltersListResult(filters=filters)
@@ -0,0 +1,49 @@
+"""Tests for the view filters MCP tools."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from nocodb.exceptions import NocoDBAPIError
+
+from . import view_filters
+
+
+@pytest.fixture
+def client(patch_client):
+    return patch_client(view_filters)
+
+
+def test_view_filters_delete_deletes_each_filter(client):
+    result = view_filters.view_filters_delete(["flt_a", "flt_b", "flt_c"], confirm=True)
+
+    assert sorted(c.args[0] for c in client.view_filter_delete.call_args_list) == ["flt_a", "flt_b", "flt_c"]
+    assert result.success is True
+    assert result.message == "Deleted 3 filter(s)"
+
+
+def test_view_filters_delete_requires_confirm(client):
+    with pytest.raises(ToolError, match="confirm=True"):
+        view_filters.view_filters_delete(["flt_a"])
+
+    client.view_filter_delete.assert_not_called()
+
+
+def test_view_filters_delete_reports_deleted_and_failed_ids(client):
+    def delete(filter_id):
+        if filter_id in ("flt_a", "flt_c"):
+            raise NocoDBAPIError(message="404 Not Found", status_code=404)
+
+    client.view_filter_delete.side_effect = delete
+
+    result = view_filters.view_filters_delete(["flt_a", "flt_b", "flt_c"], confirm=True)
+
+    assert result.success is False
+    assert result.deleted == ["flt_b"]
+    assert [f["id"] for f in result.failed] == ["flt_a", "flt_c"]
+    assert result.message == "Deleted 1 filter(s); 2 failed and were not deleted (see failed)"
+
+
+def test_view_filters_delete_raises_when_every_delete_fails(client):
+    client.view_filter_delete.side_effect = NocoDBAPIError(message="404 Not Found", status_code=404)
+
+    with pytest.raises(ToolError, match="404 Not Found"):
+        view_filters.view_filters_delete(["flt_a", "flt_b"], confirm=True)
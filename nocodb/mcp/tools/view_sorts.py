@@ -6,14 +6,26 @@ Provides CRUD operations for view sorts:
 - view_sort_create: Create a new sort
 - view_sort_update: Update a sort
 - view_sort_delete: Delete a sort (requires confirm=True)
+- view_sorts_delete: Delete several sorts at once (requires confirm=True)
 """
 
 from typing import Optional
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client
-from ..errors import wrap_api_error
-from ..models import ViewSortsListResult, ViewSortResult, ViewSortDeleteResult
+from ..errors import wrap_api_error, require_confirm, delete_each
+from ..models import ViewSortsListResult, ViewSortResult, ViewSortDeleteResult, BulkDeleteResult
+
+_VALID_DIRECTIONS = frozenset(("asc", "desc"))
+
+
+def _check_direction(direction: str) -> None:
+    """Reject unknown sort directions locally instead of waiting for the API to fail."""
+    if direction not in _VALID_DIRECTIONS:
+        from fastmcp.exceptions import ToolError
+        raise ToolError(f"Invalid direction '{direction}'. Valid directions: asc, desc")
 
 
 @mcp.tool
@@ -30,7 +42,7 @@ def view_sorts_list(view_id: str) -> ViewSortsListResult:
     client = get_client()
 
     result = client.view_sorts_list(view_id)
-    sorts = result.get("sorts", result.get("list", []))
+    sorts = result["sorts"] if "sorts" in result else result.get("list", [])
 
     return ViewSortsListResult(sorts=sorts)
 
@@ -74,6 +86,7 @@ def view_sort_create(
     Returns:
         ViewSortResult with created sort details.
     """
+    _check_direction(direction)
     client = get_client()
 
     body = {
@@ -107,18 +120,17 @@ def view_sort_update(
     Returns:
         ViewSortResult with updated sort details.
     """
-    client = get_client()
-
-    body = {}
-    if fk_column_id is not None:
-        body["fk_column_id"] = fk_column_id
     if direction is not None:
-        body["direction"] = direction
+        _check_direction(direction)
+
+    body = drop_none(fk_column_id=fk_column_id, direction=direction)
 
     if not body:
         from fastmcp.exceptions import ToolError
         raise ToolError("At least one field (fk_column_id or direction) must be provided")
 
+    client = get_client()
+
     result = client.view_sort_update(sort_id, body)
 
     return ViewSortResult(
@@ -134,6 +146,7 @@ def view_sort_update(
     "idempotentHint": True,
 })
 @wrap_api_error
+@require_confirm("delete this sort", "")
 def view_sort_delete(
     sort_id: str,
     confirm: bool = False,
@@ -147,12 +160,6 @@ def view_sort_delete(
     Returns:
         ViewSortDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete this sort."
-        )
-
     client = get_client()
 
     client.view_sort_delete(sort_id)
@@ -161,3 +168,32 @@ def view_sort_delete(
         success=True,
         message=f"Sort {sort_id} deleted",
     )
+
+
+@mcp.tool(annotations={
+    "title": "Delete Sorts",
+    "destructiveHint": True,
+    "idempotentHint": True,
+})
+@wrap_api_error
+@require_confirm("delete these sorts", "")
+def view_sorts_delete(
+    sort_ids: list[str],
+    confirm: bool = False,
+) -> BulkDeleteResult:
+    """Delete several sorts in one call.
+
+    The DELETE requests are sent concurrently, so tearing down many sorts
+    costs about one round-trip instead of one per sort. If only some of
+    them fail, success is False and the result lists the deleted and failed IDs.
+
+    Args:
+        sort_ids: The sort IDs (e.g., ["srt_xxx", "srt_yyy"])
+        confirm: Must be True to proceed with deletion
+
+    Returns:
+        BulkDeleteResult with the deleted and failed sort IDs.
+    """
+    client = get_client()
+
+    return delete_each(client.view_sort_delete, sort_ids, "sort")
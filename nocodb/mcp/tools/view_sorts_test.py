@@ -0,0 +1,79 @@
+"""Tests for the view sorts MCP tools."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from nocodb.exceptions import NocoDBAPIError
+
+from . import view_sorts
+
+
+@pytest.fixture
+def client(patch_client):
+    return patch_client(view_sorts)
+
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_view_sort_create_accepts_valid_direction(client, direction):
+    client.view_sort_create.return_value = {"id": "srt1", "fk_column_id": "fld1", "direction": direction}
+
+    result = view_sorts.view_sort_create("vw1", "fld1", direction=direction)
+
+    client.view_sort_create.assert_called_once_with("vw1", {"fk_column_id": "fld1", "direction": direction})
+    assert result.direction == direction
+
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_view_sort_update_accepts_valid_direction(client, direction):
+    client.view_sort_update.return_value = {"id": "srt1", "fk_column_id": "fld1", "direction": direction}
+
+    result = view_sorts.view_sort_update("srt1", direction=direction)
+
+    client.view_sort_update.assert_called_once_with("srt1", {"direction": direction})
+    assert result.direction == direction
+
+
+@pytest.mark.parametrize("call", [
+    lambda: view_sorts.view_sort_create("vw1", "fld1", direction="ascending"),
+    lambda: view_sorts.view_sort_update("srt1", direction="ascending"),
+])
+def test_invalid_direction_is_rejected_before_the_api(client, call):
+    with pytest.raises(ToolError, match="Invalid direction 'ascending'. Valid directions: asc, desc"):
+        call()
+
+    client.view_sort_create.assert_not_called()
+    client.view_sort_update.assert_not_called()
+
+
+def test_view_sorts_delete_deletes_each_sort(client):
+    result = view_sorts.view_sorts_delete(["srt_a", "srt_b"], confirm=True)
+
+    assert sorted(c.args[0] for c in client.view_sort_delete.call_args_list) == ["srt_a", "srt_b"]
+    assert result.message == "Deleted 2 sort(s)"
+
+
+def test_view_sorts_delete_requires_confirm(client):
+    with pytest.raises(ToolError, match="confirm=True"):
+        view_sorts.view_sorts_delete(["srt_a"])
+
+    client.view_sort_delete.assert_not_called()
+
+
+def test_view_sorts_delete_reports_deleted_and_failed_ids(client):
+    def delete(sort_id):
+        if sort_id == "srt_b":
+            raise NocoDBAPIError(message="500 Server Error", status_code=500)
+
+    client.view_sort_delete.side_effect = delete
+
+    result = view_sorts.view_sorts_delete(["srt_a", "srt_b"], confirm=True)
+
+    assert result.success is False
+    assert result.deleted == ["srt_a"]
+    assert result.failed == [{"id": "srt_b", "error": "500 Server Error (Status: 500)"}]
+
+
+def test_view_sorts_delete_raises_when_every_delete_fails(client):
+    client.view_sort_delete.side_effect = NocoDBAPIError(message="500 Server Error", status_code=500)
+
+    with pytest.raises(ToolError, match="500 Server Error"):
+        view_sorts.view_sorts_delete(["srt_a"], confirm=True)
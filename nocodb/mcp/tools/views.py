@@ -4,6 +4,7 @@ Provides operations for table views:
 - views_list: List all views for a table
 - view_update: Update view metadata
 - view_delete: Delete a view (requires confirm=True)
+- views_delete: Delete several views at once (requires confirm=True)
 
 Note: View creation is not available via API in self-hosted NocoDB.
 Use the NocoDB web UI to create new views.
@@ -11,10 +12,12 @@ Use the NocoDB web UI to create new views.
 
 from typing import Optional, Any
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client
-from ..errors import wrap_api_error
-from ..models import ViewsListResult, ViewResult, ViewDeleteResult
+from ..errors import wrap_api_error, require_confirm, delete_each
+from ..models import ViewsListResult, ViewResult, ViewDeleteResult, BulkDeleteResult
 
 
 @mcp.tool
@@ -64,20 +67,14 @@ def view_update(
     Returns:
         ViewResult with updated view details.
     """
-    client = get_client()
-
-    body: dict[str, Any] = {}
-    if title is not None:
-        body["title"] = title
-    if icon is not None:
-        body["icon"] = icon
-    if meta is not None:
-        body["meta"] = meta
+    body = drop_none(title=title, icon=icon, meta=meta)
 
     if not body:
         from fastmcp.exceptions import ToolError
         raise ToolError("At least one field (title, icon, or meta) must be provided")
 
+    client = get_client()
+
     result = client.view_update(view_id, body)
 
     return ViewResult(
@@ -94,6 +91,10 @@ def view_update(
     "idempotentHint": False,
 })
 @wrap_api_error
+@require_confirm(
+    "delete this view",
+    "The view will be removed but data remains intact.",
+)
 def view_delete(
     view_id: str,
     confirm: bool = False,
@@ -110,13 +111,6 @@ def view_delete(
     Returns:
         ViewDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete this view. "
-            "The view will be removed but data remains intact."
-        )
-
     client = get_client()
 
     client.view_delete(view_id)
@@ -125,3 +119,35 @@ def view_delete(
         success=True,
         message=f"View {view_id} deleted",
     )
+
+
+@mcp.tool(annotations={
+    "title": "Delete Views",
+    "destructiveHint": True,
+    "idempotentHint": False,
+})
+@wrap_api_error
+@require_confirm(
+    "delete these views",
+    "The views will be removed but data remains intact.",
+)
+def views_delete(
+    view_ids: list[str],
+    confirm: bool = False,
+) -> BulkDeleteResult:
+    """Delete several views in one call.
+
+    The DELETE requests are sent concurrently. Only the views are deleted,
+    not the underlying data. If only some of them fail, success is False
+    and the result lists the deleted and failed IDs.
+
+    Args:
+        view_ids: The view IDs (e.g., ["vw_xxx", "vw_yyy"])
+        confirm: Must be True to proceed with deletion
+
+    Returns:
+        BulkDeleteResult with the deleted and failed view IDs.
+    """
+    client = get_client()
+
+    return delete_each(client.view_delete, view_ids, "view")
@@ -0,0 +1,50 @@
+"""Tests for the views MCP tools."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from nocodb.exceptions import NocoDBAPIError
+
+from . import views
+
+
+@pytest.fixture
+def client(patch_client):
+    return patch_client(views)
+
+
+def test_views_delete_deletes_each_view(client):
+    result = views.views_delete(["vw_a", "vw_b", "vw_c"], confirm=True)
+
+    assert sorted(c.args[0] for c in client.view_delete.call_args_list) == ["vw_a", "vw_b", "vw_c"]
+    assert result.success is True
+    assert result.deleted == ["vw_a", "vw_b", "vw_c"]
+    assert result.message == "Deleted 3 view(s)"
+
+
+def test_views_delete_requires_confirm(client):
+    with pytest.raises(ToolError, match="confirm=True to delete these views"):
+        views.views_delete(["vw_a"])
+
+    client.view_delete.assert_not_called()
+
+
+def test_views_delete_reports_deleted_and_failed_ids(client):
+    def delete(view_id):
+        if view_id == "vw_b":
+            raise NocoDBAPIError(message="404 Not Found", status_code=404)
+
+    client.view_delete.side_effect = delete
+
+    result = views.views_delete(["vw_a", "vw_b", "vw_c"], confirm=True)
+
+    assert result.success is False
+    assert result.deleted == ["vw_a", "vw_c"]
+    assert result.failed == [{"id": "vw_b", "error": "404 Not Found (Status: 404)"}]
+    assert result.message == "Deleted 2 view(s); 1 failed and were not deleted (see failed)"
+
+
+def test_views_delete_raises_when_every_delete_fails(client):
+    client.view_delete.side_effect = NocoDBAPIError(message="403 Forbidden", status_code=403)
+
+    with pytest.raises(ToolError, match="403 Forbidden"):
+        views.views_delete(["vw_a", "vw_b"], confirm=True)
@@ -3,6 +3,7 @@
 Provides operations for webhooks:
 - webhooks_list: List all webhooks for a table
 - webhook_delete: Delete a webhook (requires confirm=True)
+- webhooks_delete: Delete several webhooks at once (requires confirm=True)
 - webhook_logs: View webhook execution logs
 - webhook_sample_payload: Get sample webhook payload
 - webhook_filters_list: List webhook filters
@@ -14,10 +15,13 @@ Use the NocoDB web UI to create and configure webhooks.
 
 from typing import Optional, Any
 
+from nocodb.utils import drop_none
+
 from ..server import mcp
 from ..dependencies import get_client
-from ..errors import wrap_api_error
+from ..errors import wrap_api_error, require_confirm, delete_each
 from ..models import (
+    BulkDeleteResult,
     WebhooksListResult,
     WebhookDeleteResult,
     WebhookLogsResult,
@@ -52,6 +56,7 @@ def webhooks_list(table_id: str) -> WebhooksListResult:
     "idempotentHint": False,
 })
 @wrap_api_error
+@require_confirm("delete this webhook", "")
 def webhook_delete(
     hook_id: str,
     confirm: bool = False,
@@ -65,12 +70,6 @@ def webhook_delete(
     Returns:
         WebhookDeleteResult with success status.
     """
-    if not confirm:
-        from fastmcp.exceptions import ToolError
-        raise ToolError(
-            "Set confirm=True to delete this webhook."
-        )
-
     client = get_client()
 
     client.webhook_delete(hook_id)
@@ -81,23 +80,60 @@ def webhook_delete(
     )
 
 
+@mcp.tool(annotations={
+    "title": "Delete Webhooks",
+    "destructiveHint": True,
+    "idempotentHint": False,
+})
+@wrap_api_error
+@require_confirm("delete these webhooks", "")
+def webhooks_delete(
+    hook_ids: list[str],
+    confirm: bool = False,
+) -> BulkDeleteResult:
+    """Delete several webhooks in one call.
+
+    The DELETE requests are sent concurrently. If only some of them fail,
+    success is False and the result lists the deleted and failed IDs.
+
+    Args:
+        hook_ids: The webhook IDs (e.g., ["hk_xxx", "hk_yyy"])
+        confirm: Must be True to proceed with deletion
+
+    Returns:
+        BulkDeleteResult with the deleted and failed webhook IDs.
+    """
+    client = get_client()
+
+    return delete_each(client.webhook_delete, hook_ids, "webhook")
+
+
 @mcp.tool
 @wrap_api_error
-def webhook_logs(hook_id: str) -> WebhookLogsResult:
+def webhook_logs(
+    hook_id: str,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> WebhookLogsResult:
     """View execution logs for a webhook.
 
-    Useful for debugging webhook delivery issues.
+    Useful for debugging webhook delivery issues. Busy webhooks can have
+    thousands of log entries with full payloads; use limit/offset to fetch
+    them a page at a time.
 
     Args:
         hook_id: The webhook ID (e.g., "hk_xxx")
+        limit: Maximum number of log entries to return (server default if omitted)
+        offset: Number of log entries to skip
 
     Returns:
         WebhookLogsResult with list of execution logs.
     """
     client = get_client()
 
-    result = client.webhook_logs(hook_id)
-    logs = result.get("logs", result.get("list", []))
+    params = drop_none(limit=limit, offset=offset)
+    result = client.webhook_logs(hook_id, params=params or None)
+    logs = result["logs"] if "logs" in result else result.get("list", [])
 
     return WebhookLogsResult(logs=logs)
 
@@ -0,0 +1,42 @@
+"""Tests for the webhooks MCP tools."""
+import pytest
+from fastmcp.exceptions import ToolError
+
+from nocodb.exceptions import NocoDBAPIError
+
+from . import webhooks
+
+
+@pytest.fixture
+def client(patch_client):
+    return patch_client(webhooks)
+
+
+def test_webhooks_delete_deletes_each_webhook(client):
+    result = webhooks.webhooks_delete(["hk_a", "hk_b"], confirm=True)
+
+    assert sorted(c.args[0] for c in client.webhook_delete.call_args_list) == ["hk_a", "hk_b"]
+    assert result.success is True
+    assert result.deleted == ["hk_a", "hk_b"]
+    assert result.message == "Deleted 2 webhook(s)"
+
+
+def test_webhooks_delete_requires_confirm(client):
+    with pytest.raises(ToolError, match="confirm=True"):
+        webhooks.webhooks_delete(["hk_a"])
+
+    client.webhook_delete.assert_not_called()
+
+
+def test_webhooks_delete_reports_deleted_and_failed_ids(client):
+    def delete(hook_id):
+        if hook_id == "hk_a":
+            raise NocoDBAPIError(message="500 Server Error", status_code=500)
+
+    client.webhook_delete.side_effect = delete
+
+    result = webhooks.webhooks_delete(["hk_a", "hk_b"], confirm=True)
+
+    assert result.success is False
+    assert result.deleted == ["hk_b"]
+    assert result.failed == [{"id": "hk_a", "error": "500 Server Error (Status: 500)"}]
@@ -47,6 +47,8 @@ class JWTAuthToken(AuthToken):
 
 
 class WhereFilter(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_where(self) -> str:
         pass
@@ -123,6 +125,7 @@ class NocoDBClient:
         base_id: str,
         table_id: str,
         record_id: Union[int, str],
+        params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Get a single record using v3 API.
 
@@ -130,6 +133,7 @@ class NocoDBClient:
             base_id: The base (project) ID
             table_id: The table ID
             record_id: The record ID
+            params: Optional query parameters (fields)
 
         Returns:
             Dict with 'id' and 'fields'
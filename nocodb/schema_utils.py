@@ -73,7 +73,7 @@ def extract_portable_table_schema(table_data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Portable table schema with title and fields array
     """
-    fields = table_data.get("fields", table_data.get("columns", []))
+    fields = table_data["fields"] if "fields" in table_data else table_data.get("columns", [])
     portable_fields = []
 
     for field in fields:
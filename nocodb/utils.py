@@ -1,4 +1,9 @@
-from typing import Callable, Dict, Any, Generator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Any, Generator, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def get_query_params(filter_obj, params=None) -> dict:
@@ -97,6 +102,7 @@ def paginate_v3(
     fetch_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
     initial_params: Optional[Dict[str, Any]] = None,
     max_pages: Optional[int] = None,
+    prefetch: bool = False,
 ) -> Generator[Dict[str, Any], None, None]:
     """
     Generator that yields all records across pages from a v3 API endpoint.
@@ -109,6 +115,9 @@ def paginate_v3(
             The response must have 'records' array and optional 'next' URL.
         initial_params: Initial query parameters (pageSize, where, sort, etc.)
         max_pages: Optional limit on number of pages to fetch (None = unlimited)
+        prefetch: If True, request the next page in a background thread while
+            the caller is still consuming the current one, so per-record work
+            overlaps the network wait. fetch_fn must be thread-safe.
 
     Yields:
         Individual records from each page (dict with 'id' and 'fields')
@@ -123,25 +132,43 @@ def paginate_v3(
     params = dict(initial_params or {})
     page = 1
     pages_fetched = 0
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending = None
+
+    try:
+        while True:
+            if max_pages is not None and pages_fetched >= max_pages:
+                break
 
-    while True:
-        if max_pages is not None and pages_fetched >= max_pages:
-            break
+            if pending is not None:
+                response = pending.result()
+                pending = None
+            else:
+                response = fetch_fn({**params, "page": page})
 
-        params["page"] = page
-        response = fetch_fn(params)
+            records = response.get("records", [])
+            pages_fetched += 1
 
-        records = response.get("records", [])
-        for record in records:
-            yield record
+            # Check if there are more pages
+            has_more = bool(response.get("next")) and bool(records)
+            page += 1
 
-        pages_fetched += 1
+            if executor is not None and has_more and (
+                max_pages is None or pages_fetched < max_pages
+            ):
+                pending = executor.submit(fetch_fn, {**params, "page": page})
 
-        # Check if there are more pages
-        if not response.get("next") or not records:
-            break
+            for record in records:
+                yield record
 
-        page += 1
+            if not has_more:
+                break
+    finally:
+        # Runs on exhaustion and when the caller stops early
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
 
 
 def collect_all_v3(
@@ -170,3 +197,216 @@ def collect_all_v3(
         )
     """
     return list(paginate_v3(fetch_fn, initial_params, max_pages))
+
+
+def drop_none(**values: Any) -> Dict[str, Any]:
+    """
+    Build a request body from keyword arguments, leaving out the ones that are None.
+
+    Used by partial-update tools, where None means "leave unchanged".
+
+    Example:
+        >>> drop_none(title="Tasks", icon=None)
+        {"title": "Tasks"}
+    """
+    return {key: value for key, value in values.items() if value is not None}
+
+
+def chunked(items: Sequence[T], size: int) -> List[Sequence[T]]:
+    """
+    Split a sequence into consecutive chunks of at most `size` items.
+
+    Example:
+        >>> chunked([1, 2, 3, 4, 5], 2)
+        [[1, 2], [3, 4], [5]]
+    """
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _checked_batch_fn(batch_fn: Callable[[Sequence[T]], List[R]]) -> Callable[[Sequence[T]], List[R]]:
+    """Wrap batch_fn so a non-list result fails loudly instead of being flattened."""
+    def call(batch: Sequence[T]) -> List[R]:
+        result = batch_fn(batch)
+        if not isinstance(result, list):
+            raise TypeError(f"batch_fn must return a list, got {type(result).__name__}")
+        return result
+    return call
+
+
+def run_batches(
+    batch_fn: Callable[[Sequence[T]], List[R]],
+    items: Sequence[T],
+    batch_size: int = 100,
+    max_workers: int = 4,
+) -> List[R]:
+    """
+    Call `batch_fn` on each chunk of `items` and concatenate the results.
+
+    When the items span more than one chunk, the calls are issued
+    concurrently from a thread pool so that N requests cost roughly one
+    round-trip of wall time instead of N. Results keep the input order.
+
+    If a call raises, the first failing chunk's exception (in input order)
+    is re-raised, but only after every other chunk has already been sent;
+    the results of the chunks that succeeded are discarded. Use
+    run_batches_collect for non-idempotent calls where the caller needs to
+    know which chunks were applied.
+
+    Args:
+        batch_fn: A callable that takes one chunk and returns a list of results.
+            It must be safe to call from several threads (a client sharing
+            one requests.Session is).
+        items: The items to split into chunks.
+        batch_size: Maximum number of items per call (default: 100).
+        max_workers: Maximum number of concurrent calls (default: 4).
+
+    Returns:
+        The concatenated results of every call, in input order.
+
+    Raises:
+        TypeError: If a call returns anything other than a list.
+
+    Example:
+        deleted = run_batches(
+            lambda ids: client.records_delete_v3(base_id, table_id, ids),
+            record_ids,
+        )
+    """
+    call = _checked_batch_fn(batch_fn)
+    batches = chunked(items, batch_size)
+    if len(batches) <= 1 or max_workers <= 1:
+        results = [call(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+            results = list(pool.map(call, batches))
+    return [item for result in results for item in result]
+
+
+@dataclass
+class BatchFailure:
+    """A chunk whose call raised, as reported by run_batches_collect."""
+    start: int
+    items: Sequence[Any]
+    error: Exception
+
+
+@dataclass
+class BatchOutcome:
+    """Per-chunk outcome of run_batches_collect."""
+    results: List[Any] = field(default_factory=list)
+    failures: List[BatchFailure] = field(default_factory=list)
+
+
+def run_batches_collect(
+    batch_fn: Callable[[Sequence[T]], List[R]],
+    items: Sequence[T],
+    batch_size: int = 100,
+    max_workers: int = 4,
+) -> BatchOutcome:
+    """
+    Like run_batches, but record each chunk's failure instead of raising.
+
+    Every chunk is attempted. The results of the chunks that succeeded are
+    concatenated in input order, and each failed chunk is reported with the
+    index of its first item, its items and the exception, so callers of
+    non-idempotent operations can tell what was applied and retry the rest.
+
+    Example:
+        outcome = run_batches_collect(
+            lambda rows: client.records_create_v3(base_id, table_id, rows),
+            rows,
+        )
+        for failure in outcome.failures:
+            retry(failure.items)
+    """
+    call = _checked_batch_fn(batch_fn)
+    batches = chunked(items, batch_size)
+
+    def attempt(batch: Sequence[T]):
+        try:
+            return call(batch), None
+        except Exception as error:
+            return None, error
+
+    if len(batches) <= 1 or max_workers <= 1:
+        attempts = [attempt(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+            attempts = list(pool.map(attempt, batches))
+
+    outcome = BatchOutcome()
+    for index, (result, error) in enumerate(attempts):
+        if error is None:
+            outcome.results.extend(result)
+        else:
+            outcome.failures.append(
+                BatchFailure(start=index * batch_size, items=batches[index], error=error)
+            )
+    return outcome
+
+
+@dataclass
+class ItemFailure:
+    """An item whose call raised, as reported by run_each."""
+    index: int
+    item: Any
+    error: Exception
+
+
+@dataclass
+class EachOutcome:
+    """Per-item outcome of run_each."""
+    succeeded: List[Any] = field(default_factory=list)
+    results: List[Any] = field(default_factory=list)
+    failures: List[ItemFailure] = field(default_factory=list)
+
+
+def run_each(
+    fn: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = 4,
+) -> EachOutcome:
+    """
+    Call `fn` once per item, concurrently, and report each item's outcome.
+
+    Meant for endpoints that take one ID per request (single GETs and
+    DELETEs). Every item is attempted; an exception is recorded against its
+    item instead of being raised, so callers can tell exactly which items
+    were applied. `succeeded` and `results` are parallel lists in input
+    order.
+
+    Args:
+        fn: A callable that takes one item. It must be safe to call from
+            several threads (a client sharing one requests.Session is).
+        items: The items to process.
+        max_workers: Maximum number of concurrent calls (default: 4).
+
+    Returns:
+        An EachOutcome with the items that succeeded, their results, and
+        an ItemFailure (input index, item, exception) for each one that raised.
+
+    Example:
+        outcome = run_each(client.view_delete, view_ids)
+        for failure in outcome.failures:
+            print(failure.item, failure.error)
+    """
+    def attempt(item: T):
+        try:
+            return fn(item), None
+        except Exception as error:
+            return None, error
+
+    if len(items) <= 1 or max_workers <= 1:
+        attempts = [attempt(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            attempts = list(pool.map(attempt, items))
+
+    outcome = EachOutcome()
+    for index, (item, (result, error)) in enumerate(zip(items, attempts)):
+        if error is None:
+            outcome.succeeded.append(item)
+            outcome.results.append(result)
+        else:
+            outcome.failures.append(ItemFailure(index=index, item=item, error=error))
+    return outcome
@@ -0,0 +1,113 @@
+"""Tests for SDK utility helpers."""
+import threading
+
+import pytest
+
+from .utils import chunked, drop_none, paginate_v3, run_batches, run_batches_collect, run_each
+
+
+def test_drop_none_keeps_falsy_values():
+    assert drop_none(title="", show=False, order=0, icon=None) == {"title": "", "show": False, "order": 0}
+    assert drop_none(icon=None) == {}
+
+
+def test_chunked_splits_into_fixed_size_chunks():
+    assert chunked([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunked([], 2) == []
+
+
+def test_run_batches_concatenates_results_in_input_order():
+    calls = []
+
+    def batch_fn(batch):
+        calls.append(list(batch))
+        return [{"id": i} for i in batch]
+
+    result = run_batches(batch_fn, list(range(7)), batch_size=3, max_workers=3)
+
+    assert result == [{"id": i} for i in range(7)]
+    assert sorted(calls) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_run_batches_single_batch_runs_inline():
+    assert run_batches(lambda batch: list(batch), ["a", "b"]) == ["a", "b"]
+
+
+def test_run_batches_rejects_non_list_results():
+    with pytest.raises(TypeError, match="must return a list, got dict"):
+        run_batches(lambda batch: {"msg": "error"}, [1, 2, 3], batch_size=2)
+
+
+def test_run_batches_raises_first_error_after_other_batches_ran():
+    calls = []
+
+    def batch_fn(batch):
+        calls.append(batch[0])
+        if batch[0] == 0:
+            raise RuntimeError("boom")
+        return list(batch)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_batches(batch_fn, list(range(6)), batch_size=2, max_workers=2)
+
+    assert sorted(calls) == [0, 2, 4]
+
+
+def test_run_batches_collect_reports_failed_chunks_and_keeps_the_rest():
+    def batch_fn(batch):
+        if batch[0] == 2:
+            raise RuntimeError("boom")
+        return list(batch)
+
+    outcome = run_batches_collect(batch_fn, list(range(6)), batch_size=2, max_workers=3)
+
+    assert outcome.results == [0, 1, 4, 5]
+    assert [(f.start, list(f.items), str(f.error)) for f in outcome.failures] == [(2, [2, 3], "boom")]
+
+
+def test_run_each_reports_each_failed_item_and_keeps_the_rest():
+    calls = []
+
+    def fn(item):
+        calls.append(item)
+        if item in ("b", "d"):
+            raise RuntimeError(f"no {item}")
+        return item.upper()
+
+    outcome = run_each(fn, ["a", "b", "c", "d"], max_workers=3)
+
+    assert sorted(calls) == ["a", "b", "c", "d"]
+    assert outcome.succeeded == ["a", "c"]
+    assert outcome.results == ["A", "C"]
+    assert [(f.index, f.item, str(f.error)) for f in outcome.failures] == [(1, "b", "no b"), (3, "d", "no d")]
+
+
+def _pages(count):
+    """Fake v3 fetch_fn serving `count` one-record pages."""
+    requested = []
+    second_page_requested = threading.Event()
+
+    def fetch(params):
+        page = params["page"]
+        requested.append(page)
+        if page == 2:
+            second_page_requested.set()
+        return {"records": [{"id": page}], "next": "more" if page < count else None}
+
+    return fetch, requested, second_page_requested
+
+
+def test_paginate_v3_prefetch_requests_next_page_before_current_is_consumed():
+    fetch, requested, second_page_requested = _pages(3)
+    records = paginate_v3(fetch, {"pageSize": 1}, prefetch=True)
+
+    assert next(records) == {"id": 1}
+    assert second_page_requested.wait(timeout=5)
+    assert list(records) == [{"id": 2}, {"id": 3}]
+    assert requested == [1, 2, 3]
+
+
+def test_paginate_v3_prefetch_respects_max_pages():
+    fetch, requested, _ = _pages(5)
+    assert list(paginate_v3(fetch, max_pages=2, prefetch=True)) == [{"id": 1}, {"id": 2}]
+    assert requested == [1, 2]
@@ -117,7 +117,7 @@ echo ""
 echo "CLI regenerated successfully!"
 echo ""
 echo "Files updated:"
-echo "  - nocodb/cli/generated.py (62 tool commands)"
+echo "  - nocodb/cli/generated.py (66 tool commands)"
 echo "  - nocodb/cli/SKILL.md (agent skill documentation)"
 echo ""
 echo "Test with:"
@@ -25,6 +25,7 @@ setup(
            # CLI is now auto-generated from MCP server
            # Uses cyclopts (via fastmcp) instead of typer
            "fastmcp>=3.0.0rc1",
+           "orjson>=3.0",
            "tomli>=2.0.0;python_version<'3.11'",
        ],
        "mcp": [
@@ -32,6 +33,7 @@ setup(
        ],
        "all": [
            "fastmcp>=3.0.0rc1",
+           "orjson>=3.0",
            "tomli>=2.0.0;python_version<'3.11'",
        ],
    },